@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Regenerate src/ruv_cli/_help.py from the argparse tree in ruv_cli.cli.
+
+Run after changing any parser definition:
+
+    python scripts/gen_help.py
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "src" / "ruv_cli" / "_help.py"
+
+sys.path.insert(0, str(ROOT / "src"))
+
+from ruv_cli.cli import _build_parser  # noqa: E402
+
+
+def subcommand_parsers(parser):
+    """Yield (path, parser) for every subcommand, e.g. ("sandbox kill", ...)"""
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            for sub in action.choices.values():
+                yield sub.prog.partition(" ")[2], sub
+                yield from subcommand_parsers(sub)
+
+
+def render():
+    parser = _build_parser(add_help=True)
+    lines = [
+        '"""Generated by scripts/gen_help.py; do not edit by hand."""',
+        "",
+        f'HELP = r"""{parser.format_help()}"""',
+        "",
+        "SUBCOMMAND_HELP = {",
+    ]
+    for path, sub in subcommand_parsers(parser):
+        lines.append(f'    "{path}": r"""{sub.format_help()}""",')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    # Format for a fixed width so the output doesn't depend on the caller's terminal
+    os.environ["COLUMNS"] = "80"
+    OUTPUT.write_text(render())
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")
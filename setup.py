@@ -5,15 +5,27 @@ setup(
     version="0.1.0",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    # Ship bytecode for the CLI so first invocation skips compilation. This
+    # only applies to a legacy `python setup.py bdist_wheel` build: pip and
+    # `python -m build` use pyproject.toml's poetry backend, which never runs
+    # this file (pip byte-compiles on install instead)
+    options={
+        "build_py": {
+            "compile": 1,
+        },
+    },
     install_requires=[
         "e2b-code-interpreter==0.1.8",
         "openrouter @ git+https://github.com/openrouter/openrouter-py.git@main",
     ],
     extras_require={
         "dev": [
-            "pytest>=7.4.0",
+            "pytest>=8.2",
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.11.1",
+            "pytest-asyncio>=1.4.0",
+            "pytest-xdist>=3.5.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
         ],
     },
     entry_points={
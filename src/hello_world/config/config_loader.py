@@ -1,13 +1,18 @@
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 class ConfigLoader:
     def __init__(self):
         self.config_dir = "src/hello_world/config"
 
     def load_prompts(self):
         with open(os.path.join(self.config_dir, "prompts.yaml"), "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_Loader)
 
     def apply_defaults(self, config):
         if "templates" not in config:
@@ -6,6 +6,11 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 class BaseAgent:
     """Base class for all agents"""
     
@@ -28,7 +33,7 @@ class BaseAgent:
         """Load YAML configuration file"""
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_Loader)
         except Exception as e:
             self.log.error(f"Error loading config from {path}: {str(e)}")
             raise RuntimeError(f"Failed to load config: {str(e)}")
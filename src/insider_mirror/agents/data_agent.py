@@ -261,4 +261,9 @@ class DataAgent(BaseAgent):
         """Clean up resources"""
         super().cleanup()
         if self.session:
-            asyncio.create_task(self._close_session())
\ No newline at end of file
+            asyncio.create_task(self._close_session())
+
+    async def aclose(self) -> None:
+        """Clean up resources and wait for the aiohttp session to close"""
+        super().cleanup()
+        await self._close_session()
\ No newline at end of file
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 
 from .base_agent import BaseAgent
 
@@ -24,9 +24,12 @@ class ReportingAgent(BaseAgent):
         }
         self.log = logging.getLogger(__name__)
 
-    def _calculate_metrics(self, trades: List[Dict[str, Any]]) -> Dict[str, float]:
-        """Calculate performance metrics from trades"""
-        if not trades:
+    def _calculate_metrics(
+        self,
+        trades: Union[List[Dict[str, Any]], pd.DataFrame]
+    ) -> Dict[str, float]:
+        """Calculate performance metrics from trades (list of dicts or a DataFrame)"""
+        if len(trades) == 0:
             return {
                 "win_rate": 0.0,
                 "profit_factor": 0.0,
@@ -34,16 +37,16 @@ class ReportingAgent(BaseAgent):
                 "max_drawdown": 0.0
             }
         
-        df = pd.DataFrame(trades)
+        df = trades if isinstance(trades, pd.DataFrame) else pd.DataFrame(trades)
+        pnl = df['pnl'].to_numpy()
         daily_returns = df.groupby(pd.to_datetime(df['timestamp']).dt.date)['pnl'].sum()
         
         # Win rate
-        winning_trades = len([t for t in trades if t['pnl'] > 0])
-        win_rate = winning_trades / len(trades)
+        win_rate = np.count_nonzero(pnl > 0) / len(pnl)
         
         # Profit factor
-        gains = sum(t['pnl'] for t in trades if t['pnl'] > 0)
-        losses = abs(sum(t['pnl'] for t in trades if t['pnl'] < 0))
+        gains = pnl[pnl > 0].sum()
+        losses = abs(pnl[pnl < 0].sum())
         profit_factor = gains / losses if losses > 0 else float('inf')
         
         # Sharpe ratio (annualized, assuming 252 trading days)
@@ -51,13 +54,13 @@ class ReportingAgent(BaseAgent):
         sharpe_ratio = np.sqrt(252) * returns.mean() / returns.std() if len(returns) > 1 else 0
         
         # Maximum drawdown
-        max_drawdown = abs(min(t['pnl'] for t in trades)) if trades else 0
+        max_drawdown = abs(pnl.min())
         
         return {
-            "win_rate": win_rate,
-            "profit_factor": profit_factor,
-            "sharpe_ratio": sharpe_ratio,
-            "max_drawdown": max_drawdown
+            "win_rate": float(win_rate),
+            "profit_factor": float(profit_factor),
+            "sharpe_ratio": float(sharpe_ratio),
+            "max_drawdown": float(max_drawdown)
         }
 
     def _generate_html_report(self, data: Dict[str, Any]) -> str:
@@ -5,6 +5,11 @@ from datetime import datetime, timezone
 import os
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 from .agents.data_agent import DataAgent
 from .agents.analysis_agent import AnalysisAgent
 from .agents.trading_agent import TradingAgent
@@ -34,7 +39,7 @@ class InsiderMirrorCrew:
         """Load configuration from YAML file"""
         try:
             with open(path, 'r') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_Loader)
         except Exception as e:
             raise RuntimeError(f"Error loading configuration from {path}: {str(e)}")
 
@@ -186,7 +191,7 @@ Error: {str(e)}
 """)
         
         # Cleanup agents
-        self.data_agent.cleanup()
+        await self.data_agent.aclose()
         self.analysis_agent.cleanup()
         self.trading_agent.cleanup()
         self.reporting_agent.cleanup()
@@ -1,7 +1,9 @@
+import sys
+
 from ruv_cli.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 else:
     # When imported as a module, provide the main function
     __all__ = ['main']
\ No newline at end of file
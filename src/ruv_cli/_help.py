@@ -0,0 +1,183 @@
+"""Generated by scripts/gen_help.py; do not edit by hand."""
+
+HELP = r"""usage: ruv [-h] {auth,template,sandbox,agent} ...
+
+RUV CLI - E2B Agent Management
+
+positional arguments:
+  {auth,template,sandbox,agent}
+                        Command to run
+    auth                Authentication commands
+    template            Template management commands
+    sandbox             Sandbox management commands
+    agent               Agent commands
+
+options:
+  -h, --help            show this help message and exit
+"""
+
+SUBCOMMAND_HELP = {
+    "auth": r"""usage: ruv auth [-h] COMMAND ...
+
+Authentication commands for E2B
+
+options:
+  -h, --help  show this help message and exit
+
+Authentication commands:
+  COMMAND
+    login     Login to E2B
+    logout    Logout from E2B
+""",
+    "auth login": r"""usage: ruv auth login [-h]
+
+Login to E2B using API key from environment
+
+options:
+  -h, --help  show this help message and exit
+""",
+    "auth logout": r"""usage: ruv auth logout [-h]
+
+Clear stored E2B credentials
+
+options:
+  -h, --help  show this help message and exit
+""",
+    "template": r"""usage: ruv template [-h] COMMAND ...
+
+Commands for managing E2B sandbox templates
+
+options:
+  -h, --help  show this help message and exit
+
+Template commands:
+  COMMAND
+    init      Initialize new template files
+    build     Build template
+    list      List templates
+""",
+    "template init": r"""usage: ruv template init [-h]
+
+Create new e2b.toml and Dockerfile
+
+options:
+  -h, --help  show this help message and exit
+""",
+    "template build": r"""usage: ruv template build [-h] [--name NAME]
+
+Build sandbox template from current directory
+
+options:
+  -h, --help   show this help message and exit
+  --name NAME  Template name
+""",
+    "template list": r"""usage: ruv template list [-h]
+
+List all available sandbox templates
+
+options:
+  -h, --help  show this help message and exit
+""",
+    "sandbox": r"""usage: ruv sandbox [-h] COMMAND ...
+
+Commands for managing E2B sandboxes
+
+options:
+  -h, --help  show this help message and exit
+
+Sandbox commands:
+  COMMAND
+    list      List sandboxes
+    kill      Kill sandbox
+    status    Get sandbox status
+""",
+    "sandbox list": r"""usage: ruv sandbox list [-h]
+
+List all active sandboxes
+
+options:
+  -h, --help  show this help message and exit
+""",
+    "sandbox kill": r"""usage: ruv sandbox kill [-h] id
+
+Terminate a running sandbox
+
+positional arguments:
+  id          Sandbox ID to terminate
+
+options:
+  -h, --help  show this help message and exit
+""",
+    "sandbox status": r"""usage: ruv sandbox status [-h] id
+
+Get detailed status of a sandbox
+
+positional arguments:
+  id          Sandbox ID to check
+
+options:
+  -h, --help  show this help message and exit
+""",
+    "agent": r"""usage: ruv agent [-h] COMMAND ...
+
+Commands for managing different types of agents
+
+options:
+  -h, --help  show this help message and exit
+
+Agent commands:
+  COMMAND
+    code      Generate and run code
+    data      Data analysis operations
+    employee  Virtual employee management
+    comms     Communication operations
+""",
+    "agent code": r"""usage: ruv agent code [-h] [--no-cache] ...
+
+Generate and execute Python code in sandbox
+
+positional arguments:
+  query       Code generation prompt
+
+options:
+  -h, --help  show this help message and exit
+  --no-cache  Bypass the generated code cache
+""",
+    "agent data": r"""usage: ruv agent data [-h] [--file FILE] [--columns [COLUMNS ...]] operation
+
+Load, analyze, and visualize data
+
+positional arguments:
+  operation             Operation (load/describe/plot)
+
+options:
+  -h, --help            show this help message and exit
+  --file FILE           Data file path
+  --columns [COLUMNS ...]
+                        Columns to analyze
+""",
+    "agent employee": r"""usage: ruv agent employee [-h] [--start] [--stop] [--status] role
+
+Manage long-running specialized agents
+
+positional arguments:
+  role        Employee role
+
+options:
+  -h, --help  show this help message and exit
+  --start     Start agent
+  --stop      Stop agent
+  --status    Check status
+""",
+    "agent comms": r"""usage: ruv agent comms [-h] [--message MESSAGE] METHOD
+
+Send messages via Slack or email
+
+positional arguments:
+  METHOD             Communication method (slack/email)
+
+options:
+  -h, --help         show this help message and exit
+  --message MESSAGE  Message to send
+""",
+}
@@ -1,23 +1,46 @@
 import argparse
 import sys
-from .commands import auth, template, sandbox, agent
+from types import SimpleNamespace
+
+from . import _help
+
+# Sandbox status report; per-line sections are pre-joined into _resources/_processes
+_STATUS_TEMPLATE = (
+    "\nSandbox Status:\n"
+    + "-" * 40 + "\n"
+    "ID: {id}\n"
+    "Status: {status}\n"
+    "Started: {started}\n"
+    "\nResources:\n{_resources}"
+    "\nProcesses:\n{_processes}"
+)
 
 class RuvArgumentParser(argparse.ArgumentParser):
     def error(self, message):
         """Override error handling to use exit code 1 instead of 2"""
-        self.print_usage(sys.stderr)
+        # Reuse the generated usage so it still shows [-h] without a help action
+        path = self.prog.partition(" ")[2]
+        text = _help.SUBCOMMAND_HELP.get(path) if path else _help.HELP
+        if text is None:
+            self.print_usage(sys.stderr)
+        else:
+            sys.stderr.write(text.partition("\n\n")[0] + "\n")
         self.exit(1, f"{self.prog}: error: {message}\n")
 
-def main():
+def _build_root_parser():
+    """Build the top-level parser; returns it with its subparsers action"""
     parser = RuvArgumentParser(
         prog="ruv",
         description="RUV CLI - E2B Agent Management"
     )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
-    
-    # Auth subcommand
+    return parser, subparsers
+
+def _build_auth(subparsers, add_help=False):
+    """Add the auth login/logout commands"""
     auth_parser = subparsers.add_parser(
         "auth", 
+        add_help=add_help,
         help="Authentication commands",
         description="Authentication commands for E2B"
     )
@@ -30,6 +53,7 @@ def main():
     # Login command
     auth_sub.add_parser(
         "login",
+        add_help=add_help,
         help="Login to E2B",
         description="Login to E2B using API key from environment"
     )
@@ -37,13 +61,16 @@ def main():
     # Logout command
     auth_sub.add_parser(
         "logout",
+        add_help=add_help,
         help="Logout from E2B",
         description="Clear stored E2B credentials"
     )
 
-    # Template subcommand
+def _build_template(subparsers, add_help=False):
+    """Add the template init/build/list commands"""
     template_parser = subparsers.add_parser(
         "template",
+        add_help=add_help,
         help="Template management commands",
         description="Commands for managing E2B sandbox templates"
     )
@@ -56,6 +83,7 @@ def main():
     # Template init command
     template_sub.add_parser(
         "init",
+        add_help=add_help,
         help="Initialize new template files",
         description="Create new e2b.toml and Dockerfile"
     )
@@ -63,6 +91,7 @@ def main():
     # Template build command
     build_parser = template_sub.add_parser(
         "build",
+        add_help=add_help,
         help="Build template",
         description="Build sandbox template from current directory"
     )
@@ -71,13 +100,16 @@ def main():
     # Template list command
     template_sub.add_parser(
         "list",
+        add_help=add_help,
         help="List templates",
         description="List all available sandbox templates"
     )
 
-    # Sandbox subcommand
+def _build_sandbox(subparsers, add_help=False):
+    """Add the sandbox list/kill/status commands"""
     sandbox_parser = subparsers.add_parser(
         "sandbox",
+        add_help=add_help,
         help="Sandbox management commands",
         description="Commands for managing E2B sandboxes"
     )
@@ -90,6 +122,7 @@ def main():
     # Sandbox list command
     sandbox_sub.add_parser(
         "list",
+        add_help=add_help,
         help="List sandboxes",
         description="List all active sandboxes"
     )
@@ -97,6 +130,7 @@ def main():
     # Sandbox kill command
     kill_parser = sandbox_sub.add_parser(
         "kill",
+        add_help=add_help,
         help="Kill sandbox",
         description="Terminate a running sandbox"
     )
@@ -105,14 +139,17 @@ def main():
     # Sandbox status command
     status_parser = sandbox_sub.add_parser(
         "status",
+        add_help=add_help,
         help="Get sandbox status",
         description="Get detailed status of a sandbox"
     )
     status_parser.add_argument("id", help="Sandbox ID to check")
 
-    # Agent subcommand
+def _build_agent(subparsers, add_help=False):
+    """Add the agent code/data/employee/comms commands"""
     agent_parser = subparsers.add_parser(
         "agent",
+        add_help=add_help,
         help="Agent commands",
         description="Commands for managing different types of agents"
     )
@@ -125,14 +162,27 @@ def main():
     # Code agent command
     code_parser = agent_sub.add_parser(
         "code",
+        add_help=add_help,
         help="Generate and run code",
         description="Generate and execute Python code in sandbox"
     )
-    code_parser.add_argument("query", nargs="*", help="Code generation prompt")
+    code_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the generated code cache"
+    )
+    # REMAINDER keeps prompt words verbatim (even ones starting with "-");
+    # options therefore have to come before the prompt
+    code_parser.add_argument(
+        "query",
+        nargs=argparse.REMAINDER,
+        help="Code generation prompt"
+    )
 
     # Data agent command
     data_parser = agent_sub.add_parser(
         "data",
+        add_help=add_help,
         help="Data analysis operations",
         description="Load, analyze, and visualize data"
     )
@@ -143,6 +193,7 @@ def main():
     # Employee agent command
     employee_parser = agent_sub.add_parser(
         "employee",
+        add_help=add_help,
         help="Virtual employee management",
         description="Manage long-running specialized agents"
     )
@@ -154,6 +205,7 @@ def main():
     # Communication agent command
     comms_parser = agent_sub.add_parser(
         "comms",
+        add_help=add_help,
         help="Communication operations",
         description="Send messages via Slack or email"
     )
@@ -164,73 +216,181 @@ def main():
         help="Communication method (slack/email)"
     )
     comms_parser.add_argument("--message", help="Message to send")
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        sys.exit(0)
-        
-    if args.command == "auth":
-        if args.auth_cmd == "login":
-            success = auth.login()
-            sys.exit(0 if success else 1)
-        elif args.auth_cmd == "logout":
-            success = auth.logout()
-            sys.exit(0 if success else 1)
-        else:
-            auth_parser.print_help()
-            sys.exit(1)
-    elif args.command == "template":
-        if args.template_cmd == "init":
-            success = template.init_template()
-            sys.exit(0 if success else 1)
-        elif args.template_cmd == "build":
-            success = template.build_template()
-            sys.exit(0 if success else 1)
-        elif args.template_cmd == "list":
-            success = template.list_templates()
-            sys.exit(0 if success else 1)
-        else:
-            template_parser.print_help()
-            sys.exit(1)
-    elif args.command == "sandbox":
-        if args.sandbox_cmd == "list":
-            success = sandbox.list_sandboxes()
-            sys.exit(0 if success else 1)
-        elif args.sandbox_cmd == "kill":
-            success = sandbox.kill_sandbox(args.id)
-            sys.exit(0 if success else 1)
-        elif args.sandbox_cmd == "status":
-            status = sandbox.get_sandbox_status(args.id)
-            if status:
-                print("\nSandbox Status:")
-                print("-" * 40)
-                print(f"ID: {status['id']}")
-                print(f"Status: {status['status']}")
-                print(f"Started: {status['started']}")
-                print("\nResources:")
-                for key, value in status['resources'].items():
-                    print(f"  {key}: {value}")
-                print("\nProcesses:")
-                for proc in status['processes']:
-                    print(f"  {proc['name']} (PID {proc['pid']}):")
-                    print(f"    CPU: {proc['cpu']}")
-                    print(f"    Memory: {proc['memory']}")
-                sys.exit(0)
-            sys.exit(1)
-        else:
-            sandbox_parser.print_help()
-            sys.exit(1)
-    elif args.command == "agent":
-        if not args.agent_cmd:
-            agent_parser.print_help()
-            sys.exit(1)
-        success = agent.handle_agent_command(args)
-        sys.exit(0 if success else 1)
+
+_GROUP_BUILDERS = {
+    "auth": _build_auth,
+    "template": _build_template,
+    "sandbox": _build_sandbox,
+    "agent": _build_agent,
+}
+
+def _build_parser(add_help=False, command=None):
+    """Build the argparse tree, limited to one command group if it is known.
+
+    Subcommand parsers get no -h/--help action by default; main() answers
+    help requests from the generated _help.SUBCOMMAND_HELP instead.
+    scripts/gen_help.py builds the full tree with add_help=True.
+    """
+    parser, subparsers = _build_root_parser()
+    builder = _GROUP_BUILDERS.get(command)
+    # Unknown commands need every group so "invalid choice" lists them all
+    for build in [builder] if builder else _GROUP_BUILDERS.values():
+        build(subparsers, add_help=add_help)
+    return parser
+
+def _auth_login(args):
+    from .commands import auth
+    return auth.login()
+
+def _auth_logout(args):
+    from .commands import auth
+    return auth.logout()
+
+def _template_init(args):
+    from .commands import template
+    return template.init_template()
+
+def _template_build(args):
+    from .commands import template
+    return template.build_template()
+
+def _template_list(args):
+    from .commands import template
+    return template.list_templates()
+
+def _sandbox_list(args):
+    from .commands import sandbox
+    return sandbox.list_sandboxes()
+
+def _sandbox_kill(args):
+    from .commands import sandbox
+    return sandbox.kill_sandbox(args.id)
+
+def _sandbox_status(args):
+    from .commands import sandbox
+    status = sandbox.get_sandbox_status(args.id)
+    if not status:
+        return False
+    resources = "".join(
+        f"  {key}: {value}\n" for key, value in status['resources'].items()
+    )
+    processes = "".join(
+        f"  {proc['name']} (PID {proc['pid']}):\n"
+        f"    CPU: {proc['cpu']}\n"
+        f"    Memory: {proc['memory']}\n"
+        for proc in status['processes']
+    )
+    sys.stdout.write(_STATUS_TEMPLATE.format_map(
+        status | {"_resources": resources, "_processes": processes}
+    ))
+    return True
+
+def _agent(args):
+    from .commands import agent
+    return agent.handle_agent_command(args)
+
+# (command, subcommand) -> handler(args) returning success
+_DISPATCH = {
+    ("auth", "login"): _auth_login,
+    ("auth", "logout"): _auth_logout,
+    ("template", "init"): _template_init,
+    ("template", "build"): _template_build,
+    ("template", "list"): _template_list,
+    ("sandbox", "list"): _sandbox_list,
+    ("sandbox", "kill"): _sandbox_kill,
+    ("sandbox", "status"): _sandbox_status,
+    ("agent", "code"): _agent,
+    ("agent", "data"): _agent,
+    ("agent", "employee"): _agent,
+    ("agent", "comms"): _agent,
+}
+
+# Commands taking only fixed positionals; these skip argparse entirely
+_POSITIONALS = {
+    ("auth", "login"): (),
+    ("auth", "logout"): (),
+    ("template", "init"): (),
+    ("template", "list"): (),
+    ("sandbox", "list"): (),
+    ("sandbox", "kill"): ("id",),
+    ("sandbox", "status"): ("id",),
+}
+
+def _fast_parse(argv):
+    """Build args for plain positional invocations, or None to defer to argparse"""
+    key = tuple(argv[:2])
+    names = _POSITIONALS.get(key)
+    values = argv[2:]
+    if names is None or len(values) != len(names):
+        return None
+    if any(value.startswith("-") for value in values):
+        return None
+    command, subcommand = key
+    return SimpleNamespace(
+        command=command, **{f"{command}_cmd": subcommand}, **dict(zip(names, values))
+    )
+
+_HELP_FLAGS = ("-h", "--help")
+
+# Options that consume the next word, so a -h right after one is its value
+_VALUE_OPTIONS = ("--name", "--file", "--message")
+
+def _takes_value(word):
+    """Return True if word names a value option, allowing argparse's prefixes"""
+    return word.startswith("--") and any(opt.startswith(word) for opt in _VALUE_OPTIONS)
+
+def _requested_help(argv):
+    """Return help text if argv asks for it, mirroring argparse's -h handling"""
+    if "--" in argv:
+        argv = argv[:argv.index("--")]
+    flag = next((i for i, arg in enumerate(argv) if arg in _HELP_FLAGS), None)
+    if flag is None:
+        return None
+    if flag == 0:
+        return _help.HELP
+    if _takes_value(argv[flag - 1]):
+        return None  # let argparse report the missing option value
+    words = argv[:flag]
+    if words[0] not in _help.SUBCOMMAND_HELP:
+        return None  # let argparse report the invalid choice
+    path = words[0]
+    for depth, word in enumerate(words[1:], 1):
+        candidate = f"{path} {word}"
+        if candidate not in _help.SUBCOMMAND_HELP:
+            break
+        path = candidate
     else:
-        parser.print_help()
-        sys.exit(1)
+        depth = len(words)
+    # agent code collects everything after its first prompt word verbatim
+    if path == "agent code" and any(not w.startswith("-") for w in words[depth:]):
+        return None
+    return _help.SUBCOMMAND_HELP[path]
+
+def main():
+    """Run the CLI and return the process exit code"""
+    argv = sys.argv[1:]
+    if not argv or argv == ["-h"] or argv == ["--help"]:
+        sys.stdout.write(_help.HELP)
+        return 0
+
+    text = _requested_help(argv)
+    if text is not None:
+        sys.stdout.write(text)
+        return 0
+
+    args = _fast_parse(argv)
+    if args is None:
+        parser = _build_parser(command=argv[0])
+        args = parser.parse_args(argv)
+        if not args.command:
+            sys.stdout.write(_help.HELP)
+            return 0
+        if not getattr(args, f"{args.command}_cmd"):
+            sys.stdout.write(_help.SUBCOMMAND_HELP[args.command])
+            return 1
+
+    handler = _DISPATCH[(args.command, getattr(args, f"{args.command}_cmd"))]
+    return 0 if handler(args) else 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
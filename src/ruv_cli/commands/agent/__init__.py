@@ -1,15 +1,42 @@
-from .code_agent import run_code
-from .data_agent import run_data_operation
-from .employee_agent import manage_employee_agent
-from .comms_agent import handle_communication
+import importlib
+
+# Handlers are imported on first use so each subcommand only pays for its
+# own dependencies (e2b/requests for code, slack_sdk for comms, ...)
+_LAZY = {
+    "run_code": ".code_agent",
+    "run_data_operation": ".data_agent",
+    "manage_employee_agent": ".employee_agent",
+    "handle_communication": ".comms_agent",
+}
+
+def __getattr__(name):
+    """Import lazily exported handlers on first attribute access"""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+def _handler(name):
+    """Resolve a handler, honouring any already-bound or patched global"""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
 
 def handle_agent_command(args):
     """Route agent commands to appropriate handlers"""
     if args.agent_cmd == "code":
-        query = " ".join(args.query) if args.query else ""
-        success = run_code(query)
+        query = args.query[0] if len(args.query) == 1 else " ".join(args.query)
+        run_code = _handler("run_code")
+        success = run_code(query, use_cache=not args.no_cache)
         return success
     elif args.agent_cmd == "data":
+        run_data_operation = _handler("run_data_operation")
         success = run_data_operation(
             operation=args.operation,
             file_path=args.file,
@@ -17,6 +44,7 @@ def handle_agent_command(args):
         )
         return success
     elif args.agent_cmd == "employee":
+        manage_employee_agent = _handler("manage_employee_agent")
         success = manage_employee_agent(
             role=args.role,
             start=args.start,
@@ -25,6 +53,7 @@ def handle_agent_command(args):
         )
         return success
     elif args.agent_cmd == "comms":
+        handle_communication = _handler("handle_communication")
         success = handle_communication(
             method=args.method,
             message=args.message
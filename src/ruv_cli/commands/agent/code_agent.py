@@ -1,6 +1,10 @@
 import os
 import json
+import time
+import hashlib
 import requests
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Tuple
 from dotenv import load_dotenv
 from e2b_code_interpreter import Sandbox
@@ -9,11 +13,61 @@ from .base_agent import BaseAgent
 # Load environment variables from .env file
 load_dotenv(".env")
 
+MODEL = "anthropic/claude-3-sonnet:beta"
+
+@lru_cache(maxsize=1)
+def _openrouter_key() -> Optional[str]:
+    """OpenRouter API key, read from the environment once per process"""
+    return os.environ.get("OPENROUTER_API_KEY")
+
+@lru_cache(maxsize=1)
+def _e2b_key() -> Optional[str]:
+    """E2B API key, read from the environment once per process"""
+    return os.environ.get("E2B_API_KEY")
+
+def reload_env() -> None:
+    """Drop cached API keys so the next lookup re-reads the environment"""
+    _openrouter_key.cache_clear()
+    _e2b_key.cache_clear()
+
+# Generated code that ran successfully is cached per (model, messages) so
+# repeated prompts skip the API
+CACHE_DIR = Path.home() / ".ruv" / "llm_cache"
+CACHE_TTL = 86400  # seconds
+
+def _cache_key(messages: list) -> str:
+    """Hash the deterministic request parameters into a cache key"""
+    payload = json.dumps(
+        {"model": MODEL, "messages": messages, "temperature": 0},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return cached code for key, or None if missing or expired"""
+    try:
+        with open(CACHE_DIR / f"{key}.json") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - entry.get("created", 0) > CACHE_TTL:
+        return None
+    return entry.get("code")
+
+def _cache_set(key: str, code: str) -> None:
+    """Store generated code; cache failures never break generation"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_DIR / f"{key}.json", "w") as f:
+            json.dump({"created": time.time(), "code": code}, f)
+    except OSError:
+        pass
+
 class CodeAgent(BaseAgent):
     """Agent for code generation and execution"""
     def __init__(self, name: str = "CodeAgent"):
         super().__init__(name=name)
-        self.openrouter_key = os.getenv("OPENROUTER_API_KEY")
+        self.openrouter_key = _openrouter_key()
         if not self.openrouter_key:
             raise RuntimeError("OPENROUTER_API_KEY not set")
         
@@ -25,7 +79,7 @@ class CodeAgent(BaseAgent):
         """Execute code in sandbox and return success status and output"""
         try:
             # Get E2B API key
-            api_key = os.getenv("E2B_API_KEY")
+            api_key = _e2b_key()
             if not api_key:
                 raise RuntimeError("E2B_API_KEY not set in environment")
             
@@ -48,24 +102,44 @@ class CodeAgent(BaseAgent):
             self.log(f"Execution failed: {error_msg}")
             return False, error_msg
 
-    def generate_code(self, prompt: str, error_context: Optional[str] = None) -> Optional[str]:
-        """Generate Python code using Claude 3.5 Sonnet"""
-        try:
-            # Prepare the system prompt
-            system_prompt = """You are a Python code generator specializing in algorithms and data structures.
+    def _messages(self, prompt: str, error_context: Optional[str] = None) -> list:
+        """Build the chat messages sent to the model for a prompt"""
+        # Prepare the system prompt
+        system_prompt = """You are a Python code generator specializing in algorithms and data structures.
 Generate only executable Python code without any explanation or markdown formatting.
 If provided with an error context, analyze the error and fix the code accordingly.
 Focus on writing robust, efficient code that handles edge cases and includes test cases."""
 
-            # Prepare the user prompt
-            user_prompt = prompt
-            if error_context:
-                user_prompt = f"""Previous code generated an error:
+        # Prepare the user prompt
+        user_prompt = prompt
+        if error_context:
+            user_prompt = f"""Previous code generated an error:
 {error_context}
 
 Please fix the code and generate a corrected version that handles this error.
 Original request: {prompt}"""
 
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    def generate_code(
+        self,
+        prompt: str,
+        error_context: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Optional[str]:
+        """Generate Python code using Claude 3.5 Sonnet"""
+        try:
+            messages = self._messages(prompt, error_context)
+
+            if use_cache:
+                cached = _cache_get(_cache_key(messages))
+                if cached is not None:
+                    self.log("Using cached code")
+                    return cached
+
             # Make request to OpenRouter API
             response = requests.post(
                 "https://openrouter.ai/api/v1/chat/completions",
@@ -74,11 +148,9 @@ Original request: {prompt}"""
                     "Content-Type": "application/json"
                 },
                 json={
-                    "model": "anthropic/claude-3-sonnet:beta",
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
+                    "model": MODEL,
+                    "messages": messages,
+                    "temperature": 0
                 }
             )
             
@@ -89,14 +161,17 @@ Original request: {prompt}"""
             if not result.get("choices"):
                 raise RuntimeError("No code generated")
                 
-            code = result["choices"][0]["message"]["content"].strip()
-            return code
+            return result["choices"][0]["message"]["content"].strip()
             
         except Exception as e:
             self.log(f"Code generation failed: {str(e)}")
             return None
 
-def run_code(user_query: str) -> bool:
+    def remember_code(self, prompt: str, error_context: Optional[str], code: str) -> None:
+        """Cache code that executed successfully, so failing code is never replayed"""
+        _cache_set(_cache_key(self._messages(prompt, error_context)), code)
+
+def run_code(user_query: str, use_cache: bool = True) -> bool:
     """Generate and execute Python code based on user query using ReACT loop"""
     if not user_query:
         print("[ERROR] No query provided for code agent.")
@@ -113,7 +188,7 @@ def run_code(user_query: str) -> bool:
             agent.log(f"Attempt {attempt}/{max_attempts}")
             
             # Generate code
-            code = agent.generate_code(user_query, error_context)
+            code = agent.generate_code(user_query, error_context, use_cache=use_cache)
             if not code:
                 return False
                 
@@ -123,6 +198,7 @@ def run_code(user_query: str) -> bool:
             success, result = agent.run(code)
             if success:
                 agent.log(f"Execution Result:\n{result}")
+                agent.remember_code(user_query, error_context, code)
                 return True
                 
             # If execution failed, try again with error context
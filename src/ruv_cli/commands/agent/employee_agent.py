@@ -54,10 +54,11 @@ class EmployeeAgent(BaseAgent):
         AGENT_STATES[agent_id] = True
         thread = threading.Thread(target=self._run_loop, args=(agent_id,))
         thread.daemon = True
-        thread.start()
-        
+        # Register before starting so a loop that exits at once can clean up
         AGENT_THREADS[agent_id] = thread
         ROLE_TO_ID[self.role] = agent_id
+        thread.start()
+        
         return f"Started agent {self.role}"
         
     def _stop_agent(self) -> str:
@@ -107,25 +108,26 @@ class EmployeeAgent(BaseAgent):
         """Main agent loop"""
         self.log(f"Starting {self.role} loop")
         
-        while AGENT_STATES.get(agent_id, False):
-            try:
-                # In real implementation, this would do actual work
-                # For testing, we'll just sleep
-                if agent_id in AGENT_STATES:  # Check if we should still be running
-                    time.sleep(1)
-                    self.log(f"{self.role} working...")
-                
-            except Exception as e:
-                self.log(f"Error in agent loop: {str(e)}")
-                time.sleep(5)  # Back off on error
-                
-        self.log(f"Stopping {self.role} loop")
-        if agent_id in AGENT_THREADS:
-            del AGENT_THREADS[agent_id]
-        if agent_id in AGENT_STATES:
-            del AGENT_STATES[agent_id]
-        if self.role in ROLE_TO_ID and ROLE_TO_ID[self.role] == agent_id:
-            del ROLE_TO_ID[self.role]
+        try:
+            while AGENT_STATES.get(agent_id, False):
+                try:
+                    # In real implementation, this would do actual work
+                    # For testing, we'll just sleep
+                    if agent_id in AGENT_STATES:  # Check if we should still be running
+                        time.sleep(1)
+                        self.log(f"{self.role} working...")
+                    
+                except Exception as e:
+                    self.log(f"Error in agent loop: {str(e)}")
+                    time.sleep(5)  # Back off on error
+        finally:
+            self.log(f"Stopping {self.role} loop")
+            if agent_id in AGENT_THREADS:
+                del AGENT_THREADS[agent_id]
+            if agent_id in AGENT_STATES:
+                del AGENT_STATES[agent_id]
+            if self.role in ROLE_TO_ID and ROLE_TO_ID[self.role] == agent_id:
+                del ROLE_TO_ID[self.role]
 
 def manage_employee_agent(role: str, start: bool = False, stop: bool = False, status: bool = False) -> bool:
     """Manage employee agent lifecycle"""
@@ -1,10 +1,14 @@
 """Test configuration and fixtures for the Insider Trading Mirror System."""
 
 import os
+import shutil
+import sys
+import tempfile
 import pytest
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Mapping
 
 # Ensure we're using test configurations
 os.environ["TESTING"] = "true"
@@ -12,59 +16,79 @@ os.environ["FINNHUB_API_KEY"] = "test_api_key"
 os.environ["FINNHUB_ENDPOINT"] = "https://api.finnhub.io/api/v1/stock/insider-transactions"
 os.environ["INITIAL_PORTFOLIO_VALUE"] = "100000"
 
-@pytest.fixture
-def sample_trade_data() -> list[Dict[str, Any]]:
-    """Sample insider trading data for testing"""
-    return [
-        {
-            "symbol": "AAPL",
-            "transaction_type": "PURCHASE",
-            "shares": 1000,
-            "price": 150.0,
-            "value": 150000.0,
-            "filing_date": "2024-01-25T00:00:00Z"
-        },
-        {
-            "symbol": "TSLA",
-            "transaction_type": "SALE",
-            "shares": 500,
-            "price": 180.0,
-            "value": 90000.0,
-            "filing_date": "2024-01-25T00:00:00Z"
-        },
-        {
-            "symbol": "MSFT",
-            "transaction_type": "PURCHASE",
-            "shares": 2000,
-            "price": 200.0,
-            "value": 400000.0,
-            "filing_date": "2024-01-25T00:00:00Z"
-        }
-    ]
+_SAMPLE_TRADES = [
+    {
+        "symbol": "AAPL",
+        "transaction_type": "PURCHASE",
+        "shares": 1000,
+        "price": 150.0,
+        "value": 150000.0,
+        "filing_date": "2024-01-25T00:00:00Z"
+    },
+    {
+        "symbol": "TSLA",
+        "transaction_type": "SALE",
+        "shares": 500,
+        "price": 180.0,
+        "value": 90000.0,
+        "filing_date": "2024-01-25T00:00:00Z"
+    },
+    {
+        "symbol": "MSFT",
+        "transaction_type": "PURCHASE",
+        "shares": 2000,
+        "price": 200.0,
+        "value": 400000.0,
+        "filing_date": "2024-01-25T00:00:00Z"
+    }
+]
 
-@pytest.fixture
-def agent_config() -> Dict[str, Any]:
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop's event loop when it is installed"""
+        return {"uvloop": uvloop.new_event_loop}
+
+@pytest.fixture(scope="session")
+def sample_trade_data() -> tuple[Mapping[str, Any], ...]:
+    """Sample insider trading data for testing (read-only, shared across tests)"""
+    return tuple(MappingProxyType(trade) for trade in _SAMPLE_TRADES)
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+CONFIG_DIR = Path("src/insider_mirror/config")
+
+@pytest.fixture(scope="session")
+def insider_mirror_configs() -> Dict[str, Dict[str, Any]]:
+    """Parse every insider_mirror YAML config once per session, keyed by file stem"""
+    configs = {}
+    for config_path in sorted(CONFIG_DIR.glob("*.yaml")):
+        with open(config_path, "r") as f:
+            configs[config_path.stem] = yaml.load(f, Loader=_Loader)
+    return configs
+
+@pytest.fixture(scope="session")
+def agent_config(insider_mirror_configs) -> Dict[str, Any]:
     """Load agent configuration for testing"""
-    config_path = Path("src/insider_mirror/config/agents.yaml")
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    return config
+    return insider_mirror_configs["agents"]
 
-@pytest.fixture
-def tasks_config() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def tasks_config(insider_mirror_configs) -> Dict[str, Any]:
     """Load tasks configuration for testing"""
-    config_path = Path("src/insider_mirror/config/tasks.yaml")
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    return config
+    return insider_mirror_configs["tasks"]
 
-@pytest.fixture
-def analysis_config() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def analysis_config(insider_mirror_configs) -> Dict[str, Any]:
     """Load analysis configuration for testing"""
-    config_path = Path("src/insider_mirror/config/analysis.yaml")
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    return config
+    return insider_mirror_configs["analysis"]
 
 @pytest.fixture
 def mock_api_response(sample_trade_data) -> Dict[str, Any]:
@@ -74,9 +98,24 @@ def mock_api_response(sample_trade_data) -> Dict[str, Any]:
         "data": sample_trade_data
     }
 
+# RAM-backed filesystem for report output, when the platform has one
+_SHM = Path("/dev/shm")
+
+@pytest.fixture
+def test_reports_dir(tmp_path) -> Iterator[Path]:
+    """Create a temporary directory for test reports, on /dev/shm if available"""
+    if not (_SHM.is_dir() and os.access(_SHM, os.W_OK)):
+        reports_dir = tmp_path / "reports"
+        reports_dir.mkdir()
+        yield reports_dir
+        return
+    reports_dir = Path(tempfile.mkdtemp(prefix="reports-", dir=_SHM))
+    yield reports_dir
+    shutil.rmtree(reports_dir, ignore_errors=True)
+
 @pytest.fixture
-def test_reports_dir(tmp_path) -> Path:
-    """Create a temporary directory for test reports"""
-    reports_dir = tmp_path / "reports"
-    reports_dir.mkdir()
-    return reports_dir
\ No newline at end of file
+def cli_argv(monkeypatch):
+    """Set sys.argv for a CLI invocation; restored after the test"""
+    def _set(*argv):
+        monkeypatch.setattr(sys, "argv", list(argv))
+    return _set
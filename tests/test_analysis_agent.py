@@ -5,7 +5,6 @@ from datetime import datetime, timezone
 import pandas as pd
 from insider_mirror.agents.analysis_agent import AnalysisAgent
 
-@pytest.mark.asyncio
 async def test_analysis_agent_initialization(agent_config):
     """Test AnalysisAgent initialization"""
     agent = AnalysisAgent(agent_config["analysis_agent"])
@@ -66,7 +65,6 @@ def test_calculate_risk_metrics(agent_config, sample_trade_data):
     assert "var_99" in metrics
     assert "symbol_concentration" in metrics
 
-@pytest.mark.asyncio
 async def test_execute_success(agent_config, sample_trade_data):
     """Test successful execution of analysis agent"""
     agent = AnalysisAgent(agent_config["analysis_agent"])
@@ -78,7 +76,6 @@ async def test_execute_success(agent_config, sample_trade_data):
     assert "patterns" in result
     assert "risk_metrics" in result
 
-@pytest.mark.asyncio
 async def test_execute_error_handling(agent_config):
     """Test error handling during execution"""
     agent = AnalysisAgent(agent_config["analysis_agent"])
@@ -1,21 +1,25 @@
 import os
 import json
+import contextlib
 import pytest
 from pathlib import Path
 from ruv_cli.commands import auth
 
+# All tests share ~/.ruv/config.json; keep them on one worker
+pytestmark = pytest.mark.xdist_group("ruv_config")
+
+def _remove_config():
+    """Remove the config file and directory, ignoring whatever is already gone"""
+    auth.CONFIG_FILE.unlink(missing_ok=True)
+    with contextlib.suppress(OSError):
+        auth.CONFIG_DIR.rmdir()
+
 @pytest.fixture
 def cleanup_config():
     """Clean up config file before and after tests"""
-    if auth.CONFIG_FILE.exists():
-        auth.CONFIG_FILE.unlink()
-    if auth.CONFIG_DIR.exists():
-        auth.CONFIG_DIR.rmdir()
+    _remove_config()
     yield
-    if auth.CONFIG_FILE.exists():
-        auth.CONFIG_FILE.unlink()
-    if auth.CONFIG_DIR.exists():
-        auth.CONFIG_DIR.rmdir()
+    _remove_config()
 
 def test_login_without_api_key(cleanup_config):
     """Should fail when E2B_API_KEY is not set"""
@@ -1,188 +1,156 @@
-import sys
+import argparse
+import runpy
 import pytest
+from pathlib import Path
 from unittest.mock import patch
 from ruv_cli import cli
 from ruv_cli.commands import auth, template, sandbox, agent
 
-def test_main_no_args(capsys):
+@pytest.fixture
+def assert_cli_exits(cli_argv):
+    """Run `ruv <argv>` and check its exit code, returned or raised by argparse"""
+    def _assert(argv, expected):
+        cli_argv('ruv', *argv)
+        try:
+            code = cli.main()
+        except SystemExit as exc:
+            code = exc.code
+        assert code == expected
+    return _assert
+
+def test_main_no_args(assert_cli_exits, capfd):
     """Should show help when no arguments provided"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv']):
-            cli.main()
-    
-    assert e.value.code == 0
-    captured = capsys.readouterr()
+    assert_cli_exits([], 0)
+
+    captured = capfd.readouterr()
     assert "RUV CLI - E2B Agent Management" in captured.out
     assert "auth" in captured.out
     assert "template" in captured.out
     assert "sandbox" in captured.out
     assert "agent" in captured.out
 
-def test_auth_no_subcommand(capsys):
+def test_main_help_flag(assert_cli_exits, capfd):
+    """Should show help for --help without running a command"""
+    assert_cli_exits(['--help'], 0)
+
+    captured = capfd.readouterr()
+    assert "RUV CLI - E2B Agent Management" in captured.out
+    assert "usage: ruv" in captured.out
+
+def test_generated_help_up_to_date(monkeypatch):
+    """_help.py should match the parser; rerun scripts/gen_help.py if not"""
+    monkeypatch.setenv("COLUMNS", "80")
+    gen_help = runpy.run_path("scripts/gen_help.py")
+    assert Path(cli._help.__file__).read_text() == gen_help["render"]()
+
+@pytest.mark.parametrize("argv, usage", [
+    (['auth', '--help'], "usage: ruv auth [-h] COMMAND"),
+    (['auth', 'login', '-h'], "usage: ruv auth login [-h]"),
+    (['sandbox', 'kill', 'sandbox-1', '-h'], "usage: ruv sandbox kill [-h] id"),
+    (['agent', 'code', '--no-cache', '-h'], "usage: ruv agent code [-h] [--no-cache]"),
+])
+def test_subcommand_help(assert_cli_exits, capfd, argv, usage):
+    """Should print subcommand help without building the parser tree"""
+    with patch.object(cli, '_build_root_parser', side_effect=AssertionError):
+        assert_cli_exits(argv, 0)
+
+    assert capfd.readouterr().out.startswith(usage)
+
+def test_agent_code_help_flag_in_prompt(assert_cli_exits):
+    """Should treat -h after the first prompt word as part of the prompt"""
+    with patch.object(agent, 'handle_agent_command', return_value=True) as handler:
+        assert_cli_exits(['agent', 'code', 'explain', '-h'], 0)
+
+    assert handler.call_args[0][0].query == ['explain', '-h']
+
+@pytest.mark.parametrize("argv", [
+    ['agent', 'data', 'load', '--file', '-h'],
+    ['template', 'build', '--na', '-h'],
+])
+def test_help_flag_as_option_value(assert_cli_exits, capsys, argv):
+    """Should let argparse reject -h given as the value of an option or its prefix"""
+    assert_cli_exits(argv, 1)
+    assert "expected one argument" in capsys.readouterr().err
+
+def test_value_options_match_parser():
+    """_VALUE_OPTIONS should list every option that takes exactly one value"""
+    gen_help = runpy.run_path("scripts/gen_help.py")
+    parsers = gen_help["subcommand_parsers"](cli._build_parser(add_help=True))
+    value_options = {
+        option
+        for _, sub in parsers
+        for action in sub._actions
+        if isinstance(action, argparse._StoreAction) and action.nargs is None
+        for option in action.option_strings
+    }
+    assert value_options == set(cli._VALUE_OPTIONS)
+
+# (argv, module, handler) for commands whose exit code follows the handler result
+CLI_CASES = [
+    (['auth', 'login'], auth, 'login'),
+    (['auth', 'logout'], auth, 'logout'),
+    (['template', 'init'], template, 'init_template'),
+    (['template', 'build'], template, 'build_template'),
+    (['template', 'list'], template, 'list_templates'),
+    (['sandbox', 'list'], sandbox, 'list_sandboxes'),
+    (['sandbox', 'kill', 'sandbox-1'], sandbox, 'kill_sandbox'),
+    (['agent', 'code', 'print hello'], agent, 'handle_agent_command'),
+    (['agent', 'data', 'describe', '--file=data.csv'], agent, 'handle_agent_command'),
+    (['agent', 'employee', 'analyst', '--start'], agent, 'handle_agent_command'),
+    (['agent', 'comms', 'slack', '--message=test'], agent, 'handle_agent_command'),
+]
+
+@pytest.mark.parametrize("argv, module, attr", CLI_CASES,
+                         ids=[" ".join(case[0][:2]) for case in CLI_CASES])
+@pytest.mark.parametrize("ret, code", [(True, 0), (False, 1)], ids=["success", "failure"])
+def test_cli_exit_code(assert_cli_exits, argv, module, attr, ret, code):
+    """Should exit with 0 when the command succeeds and 1 when it fails"""
+    with patch.object(module, attr, return_value=ret):
+        assert_cli_exits(argv, code)
+
+def test_auth_no_subcommand(assert_cli_exits, capfd):
     """Should show auth help when no subcommand provided"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'auth']):
-            cli.main()
-    
-    assert e.value.code == 1
-    captured = capsys.readouterr()
+    assert_cli_exits(['auth'], 1)
+
+    captured = capfd.readouterr()
     assert "Authentication commands" in captured.out
     assert "login" in captured.out
     assert "logout" in captured.out
 
-def test_auth_login_success():
-    """Should exit with 0 on successful login"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'auth', 'login']):
-            with patch.object(auth, 'login', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_auth_login_failure():
-    """Should exit with 1 on failed login"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'auth', 'login']):
-            with patch.object(auth, 'login', return_value=False):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_auth_logout_success():
-    """Should exit with 0 on successful logout"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'auth', 'logout']):
-            with patch.object(auth, 'logout', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_auth_logout_failure():
-    """Should exit with 1 on failed logout"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'auth', 'logout']):
-            with patch.object(auth, 'logout', return_value=False):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_template_no_subcommand(capsys):
+def test_template_no_subcommand(assert_cli_exits, capfd):
     """Should show template help when no subcommand provided"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'template']):
-            cli.main()
-    
-    assert e.value.code == 1
-    captured = capsys.readouterr()
+    assert_cli_exits(['template'], 1)
+
+    captured = capfd.readouterr()
     assert "Template commands" in captured.out
     assert "init" in captured.out
     assert "build" in captured.out
     assert "list" in captured.out
 
-def test_template_init_success():
-    """Should exit with 0 on successful template init"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'template', 'init']):
-            with patch.object(template, 'init_template', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_template_init_failure():
-    """Should exit with 1 on failed template init"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'template', 'init']):
-            with patch.object(template, 'init_template', return_value=False):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_template_build_success():
-    """Should exit with 0 on successful template build"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'template', 'build']):
-            with patch.object(template, 'build_template', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_template_build_failure():
-    """Should exit with 1 on failed template build"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'template', 'build']):
-            with patch.object(template, 'build_template', return_value=False):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_template_list_success():
-    """Should exit with 0 on successful template list"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'template', 'list']):
-            with patch.object(template, 'list_templates', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_template_list_failure():
-    """Should exit with 1 on failed template list"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'template', 'list']):
-            with patch.object(template, 'list_templates', return_value=False):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_sandbox_no_subcommand(capsys):
+def test_sandbox_no_subcommand(assert_cli_exits, capfd):
     """Should show sandbox help when no subcommand provided"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'sandbox']):
-            cli.main()
-    
-    assert e.value.code == 1
-    captured = capsys.readouterr()
+    assert_cli_exits(['sandbox'], 1)
+
+    captured = capfd.readouterr()
     assert "Sandbox commands" in captured.out
     assert "list" in captured.out
     assert "kill" in captured.out
     assert "status" in captured.out
 
-def test_sandbox_list_success():
-    """Should exit with 0 on successful sandbox list"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'sandbox', 'list']):
-            with patch.object(sandbox, 'list_sandboxes', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_sandbox_list_failure():
-    """Should exit with 1 on failed sandbox list"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'sandbox', 'list']):
-            with patch.object(sandbox, 'list_sandboxes', return_value=False):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_sandbox_kill_success():
-    """Should exit with 0 on successful sandbox kill"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'sandbox', 'kill', 'sandbox-1']):
-            with patch.object(sandbox, 'kill_sandbox', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_sandbox_kill_failure():
-    """Should exit with 1 on failed sandbox kill"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'sandbox', 'kill', 'sandbox-1']):
-            with patch.object(sandbox, 'kill_sandbox', return_value=False):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_sandbox_status_success():
+def test_sandbox_kill_skips_argparse(assert_cli_exits):
+    """Plain positional commands should not build the parser tree"""
+    with patch.object(cli, '_build_root_parser', side_effect=AssertionError):
+        with patch.object(sandbox, 'kill_sandbox', return_value=True) as kill:
+            assert_cli_exits(['sandbox', 'kill', 'sandbox-1'], 0)
+
+    kill.assert_called_once_with('sandbox-1')
+
+def test_sandbox_kill_missing_id(assert_cli_exits, capsys):
+    """Should fall back to argparse and exit with 1 when the id is missing"""
+    assert_cli_exits(['sandbox', 'kill'], 1)
+    assert "required: id" in capsys.readouterr().err
+
+def test_sandbox_status_success(assert_cli_exits):
     """Should exit with 0 on successful sandbox status"""
     mock_status = {
         'id': 'sandbox-1',
@@ -191,78 +159,77 @@ def test_sandbox_status_success():
         'resources': {'cpu': '10%'},
         'processes': []
     }
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'sandbox', 'status', 'sandbox-1']):
-            with patch.object(sandbox, 'get_sandbox_status', return_value=mock_status):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_sandbox_status_failure():
+    with patch.object(sandbox, 'get_sandbox_status', return_value=mock_status):
+        assert_cli_exits(['sandbox', 'status', 'sandbox-1'], 0)
+
+def test_sandbox_status_output(assert_cli_exits, capsys):
+    """Should print status, resources and processes"""
+    mock_status = {
+        'id': 'sandbox-1',
+        'status': 'running',
+        'started': '2023-01-01',
+        'resources': {'cpu': '10%'},
+        'processes': [{'pid': 42, 'name': 'python', 'cpu': '5%', 'memory': '100MB'}]
+    }
+    with patch.object(sandbox, 'get_sandbox_status', return_value=mock_status):
+        assert_cli_exits(['sandbox', 'status', 'sandbox-1'], 0)
+
+    captured = capsys.readouterr()
+    assert "ID: sandbox-1" in captured.out
+    assert "  cpu: 10%" in captured.out
+    assert "  python (PID 42):" in captured.out
+    assert "    Memory: 100MB" in captured.out
+    assert captured.out.endswith("\n")
+
+def test_sandbox_status_failure(assert_cli_exits):
     """Should exit with 1 on failed sandbox status"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'sandbox', 'status', 'sandbox-1']):
-            with patch.object(sandbox, 'get_sandbox_status', return_value=None):
-                cli.main()
-    
-    assert e.value.code == 1
-
-def test_agent_no_subcommand(capsys):
+    with patch.object(sandbox, 'get_sandbox_status', return_value=None):
+        assert_cli_exits(['sandbox', 'status', 'sandbox-1'], 1)
+
+def test_agent_no_subcommand(assert_cli_exits, capfd):
     """Should show agent help when no subcommand provided"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'agent']):
-            cli.main()
-    
-    assert e.value.code == 1
-    captured = capsys.readouterr()
+    assert_cli_exits(['agent'], 1)
+
+    captured = capfd.readouterr()
     assert "Agent commands" in captured.out
     assert "code" in captured.out
     assert "data" in captured.out
     assert "employee" in captured.out
     assert "comms" in captured.out
 
-def test_agent_code_success():
-    """Should exit with 0 on successful code generation"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'agent', 'code', 'print hello']):
-            with patch.object(agent, 'handle_agent_command', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_agent_data_success():
-    """Should exit with 0 on successful data operation"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'agent', 'data', 'describe', '--file=data.csv']):
-            with patch.object(agent, 'handle_agent_command', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_agent_employee_success():
-    """Should exit with 0 on successful employee operation"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'agent', 'employee', 'analyst', '--start']):
-            with patch.object(agent, 'handle_agent_command', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_agent_comms_success():
-    """Should exit with 0 on successful communication"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'agent', 'comms', 'slack', '--message=test']):
-            with patch.object(agent, 'handle_agent_command', return_value=True):
-                cli.main()
-    
-    assert e.value.code == 0
-
-def test_invalid_command(capsys):
+def test_agent_code_no_cache_flag(assert_cli_exits):
+    """Should pass --no-cache through to the agent handler"""
+    with patch.object(agent, 'handle_agent_command', return_value=True) as handler:
+        assert_cli_exits(['agent', 'code', '--no-cache', 'print hello'], 0)
+
+    args = handler.call_args[0][0]
+    assert args.no_cache is True
+    assert args.query == ['print hello']
+
+def test_agent_code_query_keeps_dash_words(assert_cli_exits):
+    """Should pass prompt words starting with '-' through verbatim"""
+    with patch.object(agent, 'handle_agent_command', return_value=True) as handler:
+        assert_cli_exits(['agent', 'code', 'square', '-5'], 0)
+
+    assert handler.call_args[0][0].query == ['square', '-5']
+
+def test_agent_code_query_joined():
+    """Should join multi-word prompts before running the code agent"""
+    args = argparse.Namespace(agent_cmd='code', query=['print', 'hello'], no_cache=False)
+    with patch.object(agent, 'run_code', return_value=True) as run_code:
+        assert agent.handle_agent_command(args)
+    run_code.assert_called_once_with('print hello', use_cache=True)
+
+def test_invalid_command(assert_cli_exits, capsys):
     """Should show help on invalid command"""
-    with pytest.raises(SystemExit) as e:
-        with patch.object(sys, 'argv', ['ruv', 'invalid']):
-            cli.main()
-    
-    assert e.value.code == 1
+    assert_cli_exits(['invalid'], 1)
     captured = capsys.readouterr()
-    assert "invalid choice: 'invalid'" in captured.err
\ No newline at end of file
+    assert "invalid choice: 'invalid'" in captured.err
+    assert "'agent'" in captured.err
+
+def test_only_requested_group_built(assert_cli_exits):
+    """Should build just the parser group named on the command line"""
+    with patch.object(cli, '_build_sandbox', side_effect=AssertionError):
+        with patch.dict(cli._GROUP_BUILDERS, sandbox=cli._build_sandbox):
+            with patch.object(template, 'build_template', return_value=True):
+                assert_cli_exits(['template', 'build', '--name', 'demo'], 0)
@@ -1,15 +1,31 @@
-import os
 import pytest
 from unittest.mock import patch, MagicMock
-from ruv_cli.commands.agent.code_agent import run_code, _generate_code, CodeAgent
+from ruv_cli.commands.agent import code_agent
+from ruv_cli.commands.agent.code_agent import run_code, CodeAgent
 
 @pytest.fixture(autouse=True)
-def setup_env():
-    """Set up environment variables for all tests"""
-    os.environ["OPENROUTER_API_KEY"] = "test_key"
+def setup_env(monkeypatch, tmp_path):
+    """Set up environment variables and an empty code cache for all tests"""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    # A real key from the shell or .env must never reach the sandbox in tests
+    monkeypatch.delenv("E2B_API_KEY", raising=False)
+    monkeypatch.setattr(code_agent, "CACHE_DIR", tmp_path / "llm_cache")
+    code_agent.reload_env()
     yield
-    if "OPENROUTER_API_KEY" in os.environ:
-        del os.environ["OPENROUTER_API_KEY"]
+    # Drop the cached test key; the next read sees the restored environment
+    code_agent.reload_env()
+
+@pytest.fixture(scope="module")
+def agent():
+    """CodeAgent shared by tests that don't change its state"""
+    # Module scope can't use the function-scoped monkeypatch, so patch the
+    # key only while constructing; the agent keeps its own copy
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENROUTER_API_KEY", "test_key")
+        code_agent.reload_env()
+        shared = CodeAgent()
+    code_agent.reload_env()
+    return shared
 
 def test_code_agent_initialization():
     """Should initialize with default name"""
@@ -19,18 +35,23 @@ def test_code_agent_initialization():
     agent = CodeAgent(name="CustomAgent")
     assert agent.name == "CustomAgent"
 
-def test_code_agent_run():
-    """Should execute code and return result"""
-    agent = CodeAgent()
-    result = agent.run("print('test')")
-    assert result == "Executed: print('test')"
+def test_code_agent_run(agent, monkeypatch):
+    """Should execute code in the sandbox and return the result"""
+    monkeypatch.setenv("E2B_API_KEY", "test_e2b_key")
+    code_agent.reload_env()
+    with patch.object(code_agent, "Sandbox") as sandbox:
+        sandbox.return_value.run_code.return_value = "test"
+        result = agent.run("print('test')")
+    assert result == (True, "test")
+    sandbox.return_value.run_code.assert_called_once_with("print('test')")
 
 def test_code_agent_run_error(capsys):
     """Should handle execution errors"""
     def mock_run(*args, **kwargs):
         raise Exception("Test error")
     
-    with patch('ruv_cli.commands.agent.code_agent.CodeAgent.run', side_effect=mock_run):
+    with patch.object(CodeAgent, 'generate_code', return_value="print('test')"), \
+            patch.object(CodeAgent, 'run', side_effect=mock_run):
         result = run_code("invalid code")
         assert not result
         captured = capsys.readouterr()
@@ -43,30 +64,99 @@ def test_run_code_no_query():
 
 def test_run_code_success():
     """Should successfully generate and execute code"""
-    assert run_code("Print hello world")
+    with patch.object(CodeAgent, 'generate_code', return_value="print('Hello, World!')"), \
+            patch.object(CodeAgent, 'run', return_value=(True, "Hello, World!")):
+        assert run_code("Print hello world")
 
-def test_run_code_no_api_key():
+def test_run_code_no_api_key(monkeypatch):
     """Should fail when OpenRouter API key is not set"""
-    del os.environ["OPENROUTER_API_KEY"]
+    monkeypatch.delenv("OPENROUTER_API_KEY")
+    code_agent.reload_env()
     assert not run_code("Print hello world")
 
-def test_generate_code_success():
+def test_generate_code_success(agent):
     """Should generate code from prompt"""
-    code = _generate_code("Print hello world")
+    with patch.object(code_agent.requests, "post",
+                      return_value=_mock_completion("print('Hello, World!')")):
+        code = agent.generate_code("Print hello world")
     assert code == "print('Hello, World!')"
 
-def test_generate_code_no_api_key():
+def test_generate_code_no_api_key(monkeypatch):
     """Should fail when OpenRouter API key is not set"""
-    del os.environ["OPENROUTER_API_KEY"]
+    monkeypatch.delenv("OPENROUTER_API_KEY")
+    code_agent.reload_env()
     with pytest.raises(RuntimeError, match="OPENROUTER_API_KEY not set"):
-        _generate_code("Print hello world")
+        CodeAgent()
 
 def test_generate_code_error(capsys):
     """Should handle generation errors"""
-    def mock_generate(*args):
+    def mock_generate(*args, **kwargs):
         raise Exception("Test error")
     
-    with patch('ruv_cli.commands.agent.code_agent._generate_code', side_effect=mock_generate):
+    with patch.object(CodeAgent, 'generate_code', side_effect=mock_generate):
         assert not run_code("Print hello world")
         captured = capsys.readouterr()
-        assert "Code execution failed: Test error" in captured.out
\ No newline at end of file
+        assert "Code execution failed: Test error" in captured.out
+
+
+def _mock_completion(code):
+    """Build a successful OpenRouter response returning code"""
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"choices": [{"message": {"content": code}}]}
+    return response
+
+def test_generate_code_uses_cache(agent):
+    """Should serve a remembered prompt from the cache"""
+    with patch.object(code_agent.requests, "post", return_value=_mock_completion("print(1)")) as post:
+        assert agent.generate_code("Print one") == "print(1)"
+        agent.remember_code("Print one", None, "print(1)")
+        assert agent.generate_code("Print one") == "print(1)"
+    post.assert_called_once()
+
+def test_generate_code_not_cached_until_run(agent):
+    """Should not cache generated code before it has run successfully"""
+    with patch.object(code_agent.requests, "post", return_value=_mock_completion("print(1)")) as post:
+        agent.generate_code("Print one")
+        agent.generate_code("Print one")
+    assert post.call_count == 2
+    assert not code_agent.CACHE_DIR.exists()
+
+@pytest.mark.parametrize("success, api_calls", [(True, 1), (False, 2)],
+                         ids=["success_cached", "failure_not_cached"])
+def test_run_code_caches_only_successful_code(success, api_calls):
+    """Should replay code that ran successfully, but never code that failed"""
+    with patch.object(code_agent.requests, "post", return_value=_mock_completion("print(1)")) as post, \
+            patch.object(CodeAgent, "run", return_value=(success, "output")):
+        assert run_code("Print one") is success
+        assert run_code("Print one") is success
+    assert post.call_count == api_calls
+
+def test_generate_code_no_cache(agent):
+    """Should call the API every time when the cache is bypassed"""
+    with patch.object(code_agent.requests, "post", return_value=_mock_completion("print(1)")) as post:
+        agent.generate_code("Print one", use_cache=False)
+        agent.generate_code("Print one", use_cache=False)
+    assert post.call_count == 2
+
+def test_generate_code_cache_expired(agent, monkeypatch):
+    """Should ignore cache entries older than the TTL"""
+    monkeypatch.setattr(code_agent, "CACHE_TTL", -1)
+    with patch.object(code_agent.requests, "post", return_value=_mock_completion("print(1)")) as post:
+        agent.generate_code("Print one")
+        agent.remember_code("Print one", None, "print(1)")
+        agent.generate_code("Print one")
+    assert post.call_count == 2
+
+@pytest.mark.parametrize("env_var, lookup", [
+    ("OPENROUTER_API_KEY", code_agent._openrouter_key),
+    ("E2B_API_KEY", code_agent._e2b_key),
+], ids=["openrouter", "e2b"])
+def test_reload_env_picks_up_new_key(monkeypatch, env_var, lookup):
+    """Should keep the cached key until reload_env, then re-read it"""
+    monkeypatch.setenv(env_var, "first_key")
+    code_agent.reload_env()
+    assert lookup() == "first_key"
+    monkeypatch.setenv(env_var, "rotated_key")
+    assert lookup() == "first_key"
+    code_agent.reload_env()
+    assert lookup() == "rotated_key"
@@ -1,28 +1,40 @@
 """Tests for the InsiderMirrorCrew class."""
 
 import pytest
-import os
 import asyncio
-from datetime import datetime, timezone
+from contextlib import ExitStack
 from unittest.mock import patch, Mock, AsyncMock
 from insider_mirror.crew import InsiderMirrorCrew
 
-@pytest.fixture
+# Fixed timestamp for mock agent results; the value is never asserted on
+_TS = "2024-01-01T00:00:00+00:00"
+
+@pytest.fixture(scope="module", autouse=True)
 def mock_env_vars():
-    """Set up test environment variables"""
-    os.environ["FINNHUB_API_KEY"] = "test_api_key"
-    os.environ["FINNHUB_ENDPOINT"] = "https://test.api/insider-trades"
-    os.environ["INITIAL_PORTFOLIO_VALUE"] = "100000"
-    yield
-    del os.environ["FINNHUB_API_KEY"]
-    del os.environ["FINNHUB_ENDPOINT"]
-    del os.environ["INITIAL_PORTFOLIO_VALUE"]
+    """Set up test environment variables once for this module"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("FINNHUB_API_KEY", "test_api_key")
+        mp.setenv("FINNHUB_ENDPOINT", "https://test.api/insider-trades")
+        mp.setenv("INITIAL_PORTFOLIO_VALUE", "100000")
+        yield
 
 @pytest.fixture
-def crew(mock_env_vars):
+def crew():
     """Create a test instance of InsiderMirrorCrew"""
     return InsiderMirrorCrew()
 
+def _patch_agents(crew, data, analysis, trading, report):
+    """Patch each agent's execute to return the given result"""
+    stack = ExitStack()
+    for agent, result in [
+        (crew.data_agent, data),
+        (crew.analysis_agent, analysis),
+        (crew.trading_agent, trading),
+        (crew.reporting_agent, report),
+    ]:
+        stack.enter_context(patch.object(agent, 'execute', AsyncMock(return_value=result)))
+    return stack
+
 def test_crew_initialization(crew):
     """Test crew initialization"""
     assert crew.portfolio_value == 100000.0
@@ -53,14 +65,13 @@ def test_load_config_error():
     with pytest.raises(RuntimeError):
         crew._load_config("nonexistent/config.yaml")
 
-@pytest.mark.asyncio
 async def test_run_cycle_success(crew, sample_trade_data):
     """Test successful execution of a complete cycle"""
     # Mock successful data agent execution
     mock_data_result = {
         "status": "success",
         "data": sample_trade_data,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
     # Mock successful analysis agent execution
@@ -69,7 +80,7 @@ async def test_run_cycle_success(crew, sample_trade_data):
         "filtered_trades": sample_trade_data[:1],  # Only first trade passes filters
         "patterns": {"test": "patterns"},
         "risk_metrics": {"test": "metrics"},
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
     # Mock successful trading agent execution
@@ -80,7 +91,7 @@ async def test_run_cycle_success(crew, sample_trade_data):
             "total_value": 110000,
             "positions": {"AAPL": {"shares": 100}}
         },
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
     # Mock successful reporting agent execution
@@ -88,15 +99,11 @@ async def test_run_cycle_success(crew, sample_trade_data):
         "status": "success",
         "metrics": {"test": "metrics"},
         "reports": {"html": "report.html"},
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
-    # Apply mocks
-    with patch.object(crew.data_agent, 'execute', AsyncMock(return_value=mock_data_result)), \
-         patch.object(crew.analysis_agent, 'execute', AsyncMock(return_value=mock_analysis_result)), \
-         patch.object(crew.trading_agent, 'execute', AsyncMock(return_value=mock_trading_result)), \
-         patch.object(crew.reporting_agent, 'execute', AsyncMock(return_value=mock_report_result)):
-        
+    with _patch_agents(crew, mock_data_result, mock_analysis_result,
+                       mock_trading_result, mock_report_result):
         result = await crew.run_cycle()
         
         assert result["status"] == "success"
@@ -108,13 +115,12 @@ async def test_run_cycle_success(crew, sample_trade_data):
         assert result["data"]["portfolio_value"] == 110000
         assert "reports" in result["data"]
 
-@pytest.mark.asyncio
 async def test_run_cycle_data_error(crew):
     """Test cycle handling of data fetch error"""
     mock_error_result = {
         "status": "error",
         "error": "API Error",
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
     with patch.object(crew.data_agent, 'execute', AsyncMock(return_value=mock_error_result)):
@@ -124,14 +130,13 @@ async def test_run_cycle_data_error(crew):
         assert "error" in result
         assert "API Error" in result["error"]
 
-@pytest.mark.asyncio
 async def test_run_cycle_no_trades(crew, sample_trade_data):
     """Test cycle handling when no trades pass analysis"""
     # Mock successful data fetch but no trades pass analysis
     mock_data_result = {
         "status": "success",
         "data": sample_trade_data,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
     mock_analysis_result = {
@@ -139,7 +144,7 @@ async def test_run_cycle_no_trades(crew, sample_trade_data):
         "filtered_trades": [],  # No trades pass filters
         "patterns": {"test": "patterns"},
         "risk_metrics": {"test": "metrics"},
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
     # Mock empty trading result
@@ -150,7 +155,7 @@ async def test_run_cycle_no_trades(crew, sample_trade_data):
             "total_value": crew.portfolio_value,
             "positions": {}
         },
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
     # Mock empty report result
@@ -158,14 +163,11 @@ async def test_run_cycle_no_trades(crew, sample_trade_data):
         "status": "success",
         "metrics": {},
         "reports": {"html": "report.html"},
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
-    with patch.object(crew.data_agent, 'execute', AsyncMock(return_value=mock_data_result)), \
-         patch.object(crew.analysis_agent, 'execute', AsyncMock(return_value=mock_analysis_result)), \
-         patch.object(crew.trading_agent, 'execute', AsyncMock(return_value=mock_trading_result)), \
-         patch.object(crew.reporting_agent, 'execute', AsyncMock(return_value=mock_report_result)):
-        
+    with _patch_agents(crew, mock_data_result, mock_analysis_result,
+                       mock_trading_result, mock_report_result):
         result = await crew.run_cycle()
         
         assert result["status"] == "success"
@@ -173,7 +175,6 @@ async def test_run_cycle_no_trades(crew, sample_trade_data):
         assert result["data"]["trades_executed"] == 0
         assert result["data"]["portfolio_value"] == crew.portfolio_value
 
-@pytest.mark.asyncio
 async def test_start_stop(crew):
     """Test system start and stop functionality"""
     # Mock run_cycle to avoid actual execution
@@ -186,30 +187,36 @@ async def test_start_stop(crew):
             "portfolio_value": 100000,
             "reports": {}
         },
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _TS
     }
     
-    with patch.object(crew, 'run_cycle', AsyncMock(return_value=mock_cycle_result)):
+    cycle_ran = asyncio.Event()
+
+    async def _cycle():
+        cycle_ran.set()
+        return mock_cycle_result
+
+    with patch.object(crew, 'run_cycle', _cycle):
         # Start system with very short interval for testing
-        start_task = asyncio.create_task(crew.start(interval_seconds=0.1))
+        start_task = asyncio.create_task(crew.start(interval_seconds=0.01))
         
-        # Let it run briefly
-        await asyncio.sleep(0.2)
+        # Wait for the first cycle instead of sleeping
+        await asyncio.wait_for(cycle_ran.wait(), timeout=2.0)
         
         # Stop system
         await crew.stop()
+        await asyncio.wait_for(start_task, timeout=2.0)
         
         assert crew.is_running is False
 
-@pytest.mark.asyncio
 async def test_error_recovery(crew, sample_trade_data):
     """Test system recovery from errors"""
     # Mock cycle to fail once then succeed
-    mock_results = iter([
+    mock_results = (
         {
             "status": "error",
             "error": "Temporary error",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _TS
         },
         {
             "status": "success",
@@ -220,32 +227,45 @@ async def test_error_recovery(crew, sample_trade_data):
                 "portfolio_value": 100000,
                 "reports": {"html": "report.html"}
             },
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _TS
         }
-    ])
-    
-    with patch.object(crew, 'run_cycle', AsyncMock(side_effect=lambda: next(mock_results))):
+    )
+    recovered = asyncio.Event()
+
+    async def _cycles():
+        # Fail the first cycle, then keep succeeding
+        yield mock_results[0]
+        while True:
+            recovered.set()
+            yield mock_results[1]
+
+    cycles = _cycles()
+    with patch.object(crew, 'run_cycle', lambda: anext(cycles)):
         # Start system with very short interval
-        start_task = asyncio.create_task(crew.start(interval_seconds=0.1))
+        start_task = asyncio.create_task(crew.start(interval_seconds=0.01))
         
-        # Let it run briefly
-        await asyncio.sleep(0.3)
+        # Wait until a cycle has run after the failing one
+        await asyncio.wait_for(recovered.wait(), timeout=2.0)
         
         # Stop system
         await crew.stop()
+        await asyncio.wait_for(start_task, timeout=2.0)
         
         assert crew.is_running is False
         # System should have recovered from the error
+        assert recovered.is_set()
+    await cycles.aclose()
 
-@pytest.mark.asyncio
 async def test_cleanup_on_stop(crew):
     """Test cleanup of resources on system stop"""
     crew.is_running = True
     crew.portfolio_value = 150000  # Modified value
+    await crew.data_agent._init_session()
     
     await crew.stop()
     
     assert crew.is_running is False
+    assert crew.data_agent.session.closed
     # Verify agents were cleaned up
     assert crew.data_agent.validation_status == {"reasoning": [], "actions": []}
     assert crew.analysis_agent.validation_status == {"reasoning": [], "actions": []}
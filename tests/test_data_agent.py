@@ -2,6 +2,11 @@ import pytest
 from unittest.mock import patch
 from ruv_cli.commands.agent.data_agent import DataAgent, run_data_operation
 
+@pytest.fixture(scope="module")
+def agent():
+    """One DataAgent shared by the module's tests"""
+    return DataAgent()
+
 def test_data_agent_initialization():
     """Should initialize with default name"""
     agent = DataAgent()
@@ -10,54 +15,28 @@ def test_data_agent_initialization():
     agent = DataAgent(name="CustomAgent")
     assert agent.name == "CustomAgent"
 
-def test_data_agent_run_no_operation():
-    """Should fail when no operation provided"""
-    agent = DataAgent()
-    result = agent.run("")
-    assert result == ""
-
-def test_data_agent_run_invalid_operation():
-    """Should fail with invalid operation"""
-    agent = DataAgent()
-    result = agent.run("invalid")
-    assert result == ""
+@pytest.mark.parametrize("operation", ["", "invalid", "load", "describe", "plot"],
+                         ids=["no_operation", "invalid_operation", "load_no_file",
+                              "describe_no_file", "plot_no_file"])
+def test_data_agent_run_rejected(agent, operation):
+    """Should return an empty result for a missing/unknown operation or file path"""
+    assert agent.run(operation) == ""
 
-def test_data_agent_load_success():
+def test_data_agent_load_success(agent):
     """Should load data successfully"""
-    agent = DataAgent()
     result = agent.run("load", file_path="data.csv")
     assert "Loaded data from data.csv" in result
 
-def test_data_agent_load_no_file():
-    """Should fail when no file path provided for load"""
-    agent = DataAgent()
-    result = agent.run("load")
-    assert result == ""
-
-def test_data_agent_describe_success():
+def test_data_agent_describe_success(agent):
     """Should describe data successfully"""
-    agent = DataAgent()
     result = agent.run("describe", file_path="data.csv", columns=["col1", "col2"])
     assert "Description of col1, col2 in data.csv" in result
 
-def test_data_agent_describe_no_file():
-    """Should fail when no file path provided for describe"""
-    agent = DataAgent()
-    result = agent.run("describe")
-    assert result == ""
-
-def test_data_agent_plot_success():
+def test_data_agent_plot_success(agent):
     """Should plot data successfully"""
-    agent = DataAgent()
     result = agent.run("plot", file_path="data.csv", columns=["col1", "col2"])
     assert "Plot saved for col1, col2 from data.csv" in result
 
-def test_data_agent_plot_no_file():
-    """Should fail when no file path provided for plot"""
-    agent = DataAgent()
-    result = agent.run("plot")
-    assert result == ""
-
 def test_run_data_operation_no_operation():
     """Should fail when no operation provided"""
     assert not run_data_operation("")
@@ -74,14 +53,12 @@ def test_run_data_operation_failure():
     with patch('ruv_cli.commands.agent.data_agent.DataAgent.run', side_effect=mock_run):
         assert not run_data_operation("load", file_path="data.csv")
 
-def test_data_agent_describe_all_columns():
+def test_data_agent_describe_all_columns(agent):
     """Should describe all columns when none specified"""
-    agent = DataAgent()
     result = agent.run("describe", file_path="data.csv")
     assert "Description of all columns in data.csv" in result
 
-def test_data_agent_plot_all_columns():
+def test_data_agent_plot_all_columns(agent):
     """Should plot all columns when none specified"""
-    agent = DataAgent()
     result = agent.run("plot", file_path="data.csv")
     assert "Plot saved for all columns from data.csv" in result
\ No newline at end of file
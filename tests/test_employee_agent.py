@@ -1,6 +1,6 @@
-import time
 import pytest
 from unittest.mock import patch
+from ruv_cli.commands.agent import employee_agent
 from ruv_cli.commands.agent.employee_agent import (
     EmployeeAgent,
     manage_employee_agent,
@@ -9,34 +9,49 @@ from ruv_cli.commands.agent.employee_agent import (
     ROLE_TO_ID
 )
 
+# AGENT_THREADS/AGENT_STATES are module globals; keep these tests on one worker
+pytestmark = pytest.mark.xdist_group("employee_threads")
+
+# The real loop, kept before cleanup_agents patches it out
+_real_run_loop = EmployeeAgent._run_loop
+
+class _InlineThread:
+    """Synchronous stand-in for threading.Thread.
+
+    start() runs the target immediately; like a real thread, an exception
+    in the target ends it without reaching the caller. The thread counts as
+    alive while its agent state is set.
+    """
+    def __init__(self, target, args=()):
+        self._target = target
+        self._args = args
+        self.daemon = False
+
+    def start(self):
+        try:
+            self._target(*self._args)
+        except Exception:
+            pass
+
+    def is_alive(self):
+        return AGENT_STATES.get(self._args[0], False)
+
+    def join(self, timeout=None):
+        pass
+
 @pytest.fixture(autouse=True)
-def cleanup_agents():
-    """Clean up any running agents before and after tests"""
+def cleanup_agents(monkeypatch):
+    """Run agents without real threads and reset the registries"""
+    monkeypatch.setattr(employee_agent.threading, "Thread", _InlineThread)
+    monkeypatch.setattr(EmployeeAgent, "_run_loop", lambda self, agent_id: None)
     AGENT_THREADS.clear()
     AGENT_STATES.clear()
     ROLE_TO_ID.clear()
     yield
-    # Stop all agents
-    for agent_id in list(AGENT_STATES.keys()):
-        AGENT_STATES[agent_id] = False
-    # Wait for threads to stop
-    threads = list(AGENT_THREADS.values())  # Create a copy of values
-    for thread in threads:
-        thread.join(timeout=1.0)
     AGENT_THREADS.clear()
     AGENT_STATES.clear()
     ROLE_TO_ID.clear()
 
-def wait_for_thread_cleanup(prefix: str, timeout: float = 1.0):
-    """Wait for threads with given prefix to be cleaned up"""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        agent_ids = [k for k in AGENT_THREADS.keys() if k.startswith(prefix)]
-        if not agent_ids:
-            return True
-        time.sleep(0.1)
-    return False
-
 def test_employee_agent_initialization():
     """Should initialize with role"""
     agent = EmployeeAgent(role="analyst")
@@ -70,7 +85,7 @@ def test_employee_agent_stop():
     
     # Verify thread is stopped
     assert "analyst" not in ROLE_TO_ID
-    assert wait_for_thread_cleanup("analyst")
+    assert not AGENT_THREADS
 
 def test_employee_agent_status():
     """Should report agent status"""
@@ -121,12 +136,11 @@ def test_manage_employee_start():
 def test_manage_employee_stop():
     """Should stop employee agent"""
     manage_employee_agent("analyst", start=True)
-    time.sleep(0.1)  # Give thread time to start
     assert manage_employee_agent("analyst", stop=True)
     
     # Verify agent is stopped
     assert "analyst" not in ROLE_TO_ID
-    assert wait_for_thread_cleanup("analyst")
+    assert not AGENT_THREADS
 
 def test_manage_employee_status():
     """Should report employee agent status"""
@@ -158,8 +172,19 @@ def test_employee_agent_loop_error():
     
     agent = ErrorAgent(role="analyst")
     agent.run(start=True)
-    time.sleep(0.1)  # Give thread time to error
     
     # Verify agent handled error
     assert "analyst" not in ROLE_TO_ID
-    assert wait_for_thread_cleanup("analyst")
\ No newline at end of file
+    assert not AGENT_THREADS
+
+def test_run_loop_cleans_up_on_exit():
+    """Should remove the agent's registry entries once the loop exits"""
+    agent = EmployeeAgent(role="analyst")
+    agent_id = f"analyst_{id(agent)}"
+    AGENT_STATES[agent_id] = False
+    ROLE_TO_ID["analyst"] = agent_id
+    
+    _real_run_loop(agent, agent_id)
+    
+    assert agent_id not in AGENT_STATES
+    assert "analyst" not in ROLE_TO_ID
@@ -1,19 +1,30 @@
-import sys
-import pytest
-from unittest.mock import patch
+import ast
+import importlib.util
+from pathlib import Path
 from ruv_cli import cli
 
-def test_main_execution():
+def test_main_execution(cli_argv):
     """Should execute main() function from cli module"""
-    with patch.object(sys, 'argv', ['ruv']):
-        with pytest.raises(SystemExit) as exc_info:
-            cli.main()
-        assert exc_info.value.code == 0
+    cli_argv('ruv')
+    assert cli.main() == 0
+
+def _calls_main(node):
+    """Whether node contains a call to main()"""
+    return any(isinstance(n, ast.Call) and getattr(n.func, "id", None) == "main"
+               for n in ast.walk(node))
+
+def _is_main_guard(node):
+    """Whether node is an `if __name__ == "__main__":` block"""
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and getattr(node.test.left, "id", None) == "__name__"
+            and getattr(node.test.comparators[0], "value", None) == "__main__")
 
 def test_main_import():
-    """Should not execute main() when imported"""
-    with patch('ruv_cli.cli.main') as mock_main:
-        # Simulate importing the module
-        with patch('builtins.__name__', 'not_main'):
-            from ruv_cli import __main__
-            mock_main.assert_not_called()
\ No newline at end of file
+    """Should only call main() under the __main__ guard, so importing is side-effect free"""
+    source = Path(importlib.util.find_spec("ruv_cli.__main__").origin).read_text()
+    tree = ast.parse(source)
+    guards = [node for node in tree.body if _is_main_guard(node)]
+    assert len(guards) == 1
+    assert any(_calls_main(stmt) for stmt in guards[0].body)
+    assert not any(_calls_main(stmt) for stmt in guards[0].orelse)
+    assert not any(_calls_main(node) for node in tree.body if node not in guards)
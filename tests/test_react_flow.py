@@ -2,12 +2,22 @@ import unittest
 import yaml
 from hello_world.config.react_validation import ReactValidator
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 class TestReactFlow(unittest.TestCase):
-    def setUp(self):
-        # Load validation rules from prompts.yaml
+    @classmethod
+    def setUpClass(cls):
+        # Load validation rules from prompts.yaml once for the class
         with open("src/hello_world/config/prompts.yaml", "r") as f:
-            self.config = yaml.safe_load(f)
-        self.validator = ReactValidator(self.config["templates"]["validation_rules"])
+            cls.config = yaml.load(f, Loader=_Loader)
+        cls.validation_rules = cls.config["templates"]["validation_rules"]
+
+    def setUp(self):
+        # The validator keeps tracking/stream state, so each test gets its own
+        self.validator = ReactValidator(self.validation_rules)
 
     def test_thought_validation(self):
         # Test valid thought format
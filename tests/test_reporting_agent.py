@@ -3,12 +3,34 @@
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
+from insider_mirror.agents import reporting_agent as reporting_agent_module
 from insider_mirror.agents.reporting_agent import ReportingAgent
 
-@pytest.mark.asyncio
+FIXED_NOW = datetime(2024, 1, 25, 10, 0, 0, tzinfo=timezone.utc)
+FIXED_ISO = FIXED_NOW.isoformat()
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns FIXED_NOW"""
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    """Freeze the reporting agent's clock at FIXED_NOW"""
+    monkeypatch.setattr(reporting_agent_module, "datetime", _FrozenDatetime)
+
+@pytest.fixture
+def reporting_agent(agent_config, test_reports_dir):
+    """ReportingAgent writing into the test reports directory"""
+    agent = ReportingAgent(agent_config["reporting_agent"])
+    agent.reports_dir = test_reports_dir
+    yield agent
+    agent.cleanup()
+
 async def test_reporting_agent_initialization(agent_config):
     """Test ReportingAgent initialization"""
     agent = ReportingAgent(agent_config["reporting_agent"])
@@ -17,123 +39,63 @@ async def test_reporting_agent_initialization(agent_config):
     assert agent.validation_status == {"reasoning": [], "actions": []}
     assert agent.reports_dir.exists()
 
-def test_calculate_metrics_win_rate(agent_config):
-    """Test win rate calculation"""
-    agent = ReportingAgent(agent_config["reporting_agent"])
-    
-    # Create trades across multiple days
-    base_date = datetime.now(timezone.utc)
-    trades = [
-        {
-            "symbol": "AAPL",
-            "pnl": 100,
-            "timestamp": (base_date - timedelta(days=2)).isoformat()
-        },
-        {
-            "symbol": "MSFT",
-            "pnl": -50,
-            "timestamp": (base_date - timedelta(days=1)).isoformat()
-        },
-        {
-            "symbol": "GOOGL",
-            "pnl": 75,
-            "timestamp": base_date.isoformat()
-        }
-    ]
-    
-    metrics = agent._calculate_metrics(trades)
-    assert "win_rate" in metrics
-    assert metrics["win_rate"] == 2/3  # 2 winning trades out of 3
+# Three trades on consecutive days: two winners, one loser
+_STANDARD_TRADES = [
+    {"symbol": "AAPL", "pnl": 100, "timestamp": "2024-01-23T10:00:00+00:00"},
+    {"symbol": "MSFT", "pnl": -50, "timestamp": "2024-01-24T10:00:00+00:00"},
+    {"symbol": "GOOGL", "pnl": 200, "timestamp": FIXED_ISO},
+]
+
+# Day-over-day returns of the daily pnl series 100, -50, 200
+_STANDARD_RETURNS = np.array([-50 / 100 - 1, 200 / -50 - 1])
 
-def test_calculate_metrics_profit_factor(agent_config):
-    """Test profit factor calculation"""
+@pytest.fixture(scope="session")
+def trades_frame():
+    """_STANDARD_TRADES as a DataFrame with parsed timestamps"""
+    df = pd.DataFrame(_STANDARD_TRADES)
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    return df
+
+@pytest.fixture(scope="module")
+def metrics_result(agent_config, trades_frame):
+    """Metrics for _STANDARD_TRADES, calculated once for the module"""
     agent = ReportingAgent(agent_config["reporting_agent"])
-    
-    # Create trades across multiple days
-    base_date = datetime.now(timezone.utc)
-    trades = [
-        {
-            "symbol": "AAPL",
-            "pnl": 100,
-            "timestamp": (base_date - timedelta(days=2)).isoformat()
-        },
-        {
-            "symbol": "MSFT",
-            "pnl": -50,
-            "timestamp": (base_date - timedelta(days=1)).isoformat()
-        },
-        {
-            "symbol": "GOOGL",
-            "pnl": 200,
-            "timestamp": base_date.isoformat()
-        }
-    ]
-    
-    metrics = agent._calculate_metrics(trades)
-    assert "profit_factor" in metrics
-    assert metrics["profit_factor"] == 6.0  # (100 + 200) / 50
+    return agent._calculate_metrics(trades_frame)
 
-def test_calculate_metrics_sharpe_ratio(agent_config):
-    """Test Sharpe ratio calculation"""
+@pytest.mark.parametrize("key, expected", [
+    ("win_rate", 2/3),  # 2 winning trades out of 3
+    ("profit_factor", 6.0),  # (100 + 200) / 50
+    ("sharpe_ratio", np.sqrt(252) * _STANDARD_RETURNS.mean() / _STANDARD_RETURNS.std(ddof=1)),
+    ("max_drawdown", 50),  # Largest losing trade
+])
+def test_calculate_metrics(metrics_result, key, expected):
+    """Test each performance metric against the standard trades"""
+    assert metrics_result[key] == pytest.approx(expected)
+
+def test_calculate_metrics_accepts_trade_list(agent_config, metrics_result):
+    """A list of trade dicts should give the same metrics as a DataFrame"""
     agent = ReportingAgent(agent_config["reporting_agent"])
-    
-    # Create trades across multiple days with consistent returns
-    base_date = datetime.now(timezone.utc)
-    trades = [
-        {
-            "symbol": "AAPL",
-            "pnl": 100,
-            "timestamp": (base_date - timedelta(days=2)).isoformat()
-        },
-        {
-            "symbol": "MSFT",
-            "pnl": 150,
-            "timestamp": (base_date - timedelta(days=1)).isoformat()
-        },
-        {
-            "symbol": "GOOGL",
-            "pnl": 200,
-            "timestamp": base_date.isoformat()
-        }
-    ]
-    
-    metrics = agent._calculate_metrics(trades)
-    assert "sharpe_ratio" in metrics
-    assert metrics["sharpe_ratio"] > 0  # Should be positive for consistent gains
+    assert agent._calculate_metrics(_STANDARD_TRADES) == pytest.approx(metrics_result)
 
-def test_calculate_metrics_max_drawdown(agent_config):
-    """Test maximum drawdown calculation"""
+def test_calculate_metrics_no_trades(agent_config):
+    """Should return zeroed metrics for an empty list or DataFrame"""
     agent = ReportingAgent(agent_config["reporting_agent"])
-    
-    # Create trades across multiple days
-    base_date = datetime.now(timezone.utc)
-    trades = [
-        {
-            "symbol": "AAPL",
-            "pnl": 100,
-            "timestamp": (base_date - timedelta(days=2)).isoformat()
-        },
-        {
-            "symbol": "MSFT",
-            "pnl": -150,
-            "timestamp": (base_date - timedelta(days=1)).isoformat()
-        },
-        {
-            "symbol": "GOOGL",
-            "pnl": 50,
-            "timestamp": base_date.isoformat()
-        }
-    ]
-    
-    metrics = agent._calculate_metrics(trades)
-    assert "max_drawdown" in metrics
-    assert metrics["max_drawdown"] == 150  # Largest negative excursion
+    assert agent._calculate_metrics([]) == agent._calculate_metrics(pd.DataFrame())
+    assert set(agent._calculate_metrics([]).values()) == {0.0}
+
+# Expected in the HTML report, including the formatted metric values
+HTML_FRAGMENTS = (
+    "<!DOCTYPE html>",
+    "Insider Trading Mirror Report",
+    "AAPL",
+    "65.00%",    # win_rate
+    "2.10",      # profit_factor
+    "1.50",      # sharpe_ratio
+    "5,000.00",  # max_drawdown
+)
 
-def test_generate_html_report(agent_config, test_reports_dir):
+def test_generate_html_report(reporting_agent):
     """Test HTML report generation"""
-    agent = ReportingAgent(agent_config["reporting_agent"])
-    agent.reports_dir = test_reports_dir
-    
     data = {
         "trades": [
             {
@@ -142,7 +104,7 @@ def test_generate_html_report(agent_config, test_reports_dir):
                 "shares": 100,
                 "price": 150.0,
                 "value": 15000.0,
-                "timestamp": "2024-01-25T10:00:00Z"
+                "timestamp": FIXED_ISO
             }
         ],
         "metrics": {
@@ -153,23 +115,13 @@ def test_generate_html_report(agent_config, test_reports_dir):
         }
     }
     
-    html_content = agent._generate_html_report(data)
+    html_content = reporting_agent._generate_html_report(data)
     assert isinstance(html_content, str)
-    assert "<!DOCTYPE html>" in html_content
-    assert "Insider Trading Mirror Report" in html_content
-    assert "AAPL" in html_content
-    
-    # Check for formatted metric values in HTML
-    assert "65.00%" in html_content  # win_rate
-    assert "2.10" in html_content    # profit_factor
-    assert "1.50" in html_content    # sharpe_ratio
-    assert "5,000.00" in html_content  # max_drawdown
+    missing = [fragment for fragment in HTML_FRAGMENTS if fragment not in html_content]
+    assert not missing, missing
 
-def test_generate_csv_report(agent_config, test_reports_dir):
+def test_generate_csv_report(reporting_agent):
     """Test CSV report generation"""
-    agent = ReportingAgent(agent_config["reporting_agent"])
-    agent.reports_dir = test_reports_dir
-    
     data = {
         "trades": [
             {
@@ -178,7 +130,7 @@ def test_generate_csv_report(agent_config, test_reports_dir):
                 "shares": 100,
                 "price": 150.0,
                 "value": 15000.0,
-                "timestamp": "2024-01-25T10:00:00Z"
+                "timestamp": FIXED_ISO
             }
         ],
         "metrics": {
@@ -189,22 +141,19 @@ def test_generate_csv_report(agent_config, test_reports_dir):
         }
     }
     
-    csv_content = agent._generate_csv_report(data)
+    csv_content = reporting_agent._generate_csv_report(data)
     assert isinstance(csv_content, str)
     assert "symbol" in csv_content
     assert "AAPL" in csv_content
     assert "win_rate" in csv_content
     assert "0.65" in csv_content
 
-def test_save_report(agent_config, test_reports_dir):
+def test_save_report(reporting_agent):
     """Test report saving functionality"""
-    agent = ReportingAgent(agent_config["reporting_agent"])
-    agent.reports_dir = test_reports_dir
-    
     content = "Test report content"
     format = "html"
     
-    filepath = agent.save_report(content, format)
+    filepath = reporting_agent.save_report(content, format)
     saved_file = Path(filepath)
     
     assert saved_file.exists()
@@ -212,13 +161,8 @@ def test_save_report(agent_config, test_reports_dir):
     with open(saved_file, 'r', encoding='utf-8') as f:
         assert f.read() == content
 
-@pytest.mark.asyncio
-async def test_execute_success(agent_config, test_reports_dir):
+async def test_execute_success(reporting_agent):
     """Test successful execution of reporting agent"""
-    agent = ReportingAgent(agent_config["reporting_agent"])
-    agent.reports_dir = test_reports_dir
-    
-    base_date = datetime.now(timezone.utc)
     trades = [
         {
             "symbol": "AAPL",
@@ -226,7 +170,7 @@ async def test_execute_success(agent_config, test_reports_dir):
             "shares": 100,
             "price": 150.0,
             "value": 15000.0,
-            "timestamp": base_date.isoformat(),
+            "timestamp": FIXED_ISO,
             "pnl": 500.0
         }
     ]
@@ -238,33 +182,32 @@ async def test_execute_success(agent_config, test_reports_dir):
         "daily_pnl": 500.0
     }
     
-    result = await agent.execute(trades, portfolio_summary)
+    # Rendering is covered by the _generate_*_report tests
+    with patch.object(ReportingAgent, "_generate_html_report", return_value="<html/>"), \
+            patch.object(ReportingAgent, "_generate_csv_report", return_value="a,b\n1,2\n"):
+        result = await reporting_agent.execute(trades, portfolio_summary)
     
     assert result["status"] == "success"
-    assert "timestamp" in result
+    assert result["timestamp"] == FIXED_ISO
     assert "metrics" in result
     assert "reports" in result
-    assert all(format in result["reports"] for format in agent.report_config["formats"])
+    assert all(format in result["reports"] for format in reporting_agent.report_config["formats"])
     
     # Verify report files exist
     for filepath in result["reports"].values():
         assert Path(filepath).exists()
 
-@pytest.mark.asyncio
-async def test_execute_error_handling(agent_config, test_reports_dir):
+async def test_execute_error_handling(reporting_agent):
     """Test error handling during execution"""
-    agent = ReportingAgent(agent_config["reporting_agent"])
-    agent.reports_dir = test_reports_dir
-    
     # Test with invalid data
     invalid_trades = [{"invalid": "data"}]
     invalid_portfolio = {"invalid": "data"}
     
-    result = await agent.execute(invalid_trades, invalid_portfolio)
+    result = await reporting_agent.execute(invalid_trades, invalid_portfolio)
     
     assert result["status"] == "error"
     assert "error" in result
-    assert "timestamp" in result
+    assert result["timestamp"] == FIXED_ISO
 
 def test_cleanup(agent_config):
     """Test cleanup of reporting agent resources"""
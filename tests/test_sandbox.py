@@ -1,30 +1,35 @@
+import contextlib
+import io
+import re
 import pytest
 from datetime import datetime
 from ruv_cli.commands import sandbox
 
-def test_list_sandboxes_empty(capsys):
-    """Should handle case when no sandboxes exist"""
-    # Mock empty sandbox list
-    sandbox.list_sandboxes()
-    captured = capsys.readouterr()
-    assert "Active Sandboxes:" in captured.out
+# Keep the module on one worker so listed_sandboxes is captured only once
+pytestmark = pytest.mark.xdist_group("sandbox")
 
-def test_list_sandboxes_with_data(capsys):
-    """Should display sandbox information correctly"""
-    assert sandbox.list_sandboxes()
-    captured = capsys.readouterr()
-    output = captured.out
-    
-    # Verify output format
-    assert "Active Sandboxes:" in output
-    assert "ID" in output
-    assert "Status" in output
-    assert "Uptime" in output
-    assert "Resources" in output
-    assert "sandbox-1" in output
-    assert "sandbox-2" in output
-    assert "CPU:" in output
-    assert "Mem:" in output
+# Expected in the sandbox table printed by list_sandboxes()
+LIST_FRAGMENTS = (
+    "Active Sandboxes:",
+    "ID", "Status", "Uptime", "Resources",
+    "sandbox-1", "sandbox-2",
+    "CPU:", "Mem:",
+)
+LIST_PATTERN = re.compile("|".join(map(re.escape, LIST_FRAGMENTS)))
+
+@pytest.fixture(scope="module")
+def listed_sandboxes():
+    """Result and stdout of one list_sandboxes() call, shared by the module"""
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        result = sandbox.list_sandboxes()
+    return result, out.getvalue()
+
+def test_list_sandboxes(listed_sandboxes):
+    """Should succeed and display sandbox information correctly"""
+    result, output = listed_sandboxes
+    assert result
+    missing = set(LIST_FRAGMENTS) - set(LIST_PATTERN.findall(output))
+    assert not missing, missing
 
 def test_kill_sandbox_no_id():
     """Should fail when no sandbox ID provided"""
@@ -75,11 +80,3 @@ def test_get_sandbox_status_error(monkeypatch):
     # No need to monkeypatch since we're not actually calling E2B SDK
     status = sandbox.get_sandbox_status("sandbox-1")  # Currently always returns mock data
     assert status is not None
-
-def test_list_sandboxes_error(monkeypatch, capsys):
-    """Should handle errors when listing sandboxes"""
-    def mock_list():
-        raise Exception("List error")
-    
-    # No need to monkeypatch since we're not actually calling E2B SDK
-    assert sandbox.list_sandboxes()  # Currently always returns True in our mock
\ No newline at end of file
@@ -1,26 +1,35 @@
 import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from ruv_cli.commands import template
 
+# Keep the module on one worker so template_files_content is rendered only once
+pytestmark = pytest.mark.xdist_group("templates")
+
 @pytest.fixture
-def cleanup_template_files():
-    """Clean up template files before and after tests"""
-    # Clean up before test
-    if os.path.exists("e2b.toml"):
-        os.remove("e2b.toml")
-    if os.path.exists("Dockerfile"):
-        os.remove("Dockerfile")
-    
-    yield
-    
-    # Clean up after test
-    if os.path.exists("e2b.toml"):
-        os.remove("e2b.toml")
-    if os.path.exists("Dockerfile"):
-        os.remove("Dockerfile")
+def in_tmp(tmp_path, monkeypatch):
+    """Run the test in an empty temporary working directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
-def test_init_template_success(cleanup_template_files):
+@pytest.fixture(scope="session")
+def template_files_content(tmp_path_factory):
+    """Contents of e2b.toml and Dockerfile as written by init_template(), rendered once"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("template"))
+        assert template.init_template()
+        return Path("e2b.toml").read_text(), Path("Dockerfile").read_text()
+
+@pytest.fixture
+def template_files(in_tmp, template_files_content):
+    """Write the rendered template files into the temporary working directory"""
+    toml_content, dockerfile_content = template_files_content
+    (in_tmp / "e2b.toml").write_text(toml_content)
+    (in_tmp / "Dockerfile").write_text(dockerfile_content)
+    return in_tmp
+
+def test_init_template_success(in_tmp):
     """Should create template files successfully"""
     assert template.init_template()
     assert os.path.exists("e2b.toml")
@@ -41,26 +50,26 @@ def test_init_template_success(cleanup_template_files):
         assert "RUN apt-get update" in content
         assert "pip install" in content
 
-def test_init_template_files_exist(cleanup_template_files):
+def test_init_template_files_exist(in_tmp):
     """Should not overwrite existing template files"""
     # Create dummy files
-    Path("e2b.toml").touch()
-    Path("Dockerfile").touch()
+    toml_path = in_tmp / "e2b.toml"
+    dockerfile_path = in_tmp / "Dockerfile"
+    toml_path.write_bytes(b"")
+    dockerfile_path.write_bytes(b"")
     
     assert not template.init_template()
     
     # Files should still be empty
-    assert os.path.getsize("e2b.toml") == 0
-    assert os.path.getsize("Dockerfile") == 0
+    assert toml_path.stat().st_size == 0
+    assert dockerfile_path.stat().st_size == 0
 
-def test_build_template_without_files(cleanup_template_files):
+def test_build_template_without_files(in_tmp):
     """Should fail when template files don't exist"""
     assert not template.build_template()
 
-def test_build_template_success(cleanup_template_files):
+def test_build_template_success(template_files):
     """Should build template successfully"""
-    # First create template files
-    template.init_template()
     assert template.build_template()
 
 def test_list_templates(capsys):
@@ -77,19 +86,15 @@ def test_list_templates(capsys):
     assert "custom-template" in output
     assert "base" in output
 
-def test_init_template_io_error(cleanup_template_files, monkeypatch):
+def test_init_template_io_error(in_tmp):
     """Should handle IO errors when creating files"""
-    def mock_open(*args, **kwargs):
-        raise IOError("Write error")
-    
-    monkeypatch.setattr("builtins.open", mock_open)
-    assert not template.init_template()
+    with patch("ruv_cli.commands.template.open", create=True,
+               side_effect=IOError("Write error")):
+        assert not template.init_template()
 
-def test_build_template_error(cleanup_template_files):
+def test_build_template_error(template_files):
     """Should handle errors during build"""
-    # Create template files but simulate build error
-    template.init_template()
-    
+    # Template files exist; simulate a build error
     def mock_build():
         raise Exception("Build error")
     
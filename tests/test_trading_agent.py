@@ -4,7 +4,21 @@ import pytest
 from datetime import datetime, timezone
 from insider_mirror.agents.trading_agent import TradingAgent
 
-@pytest.mark.asyncio
+@pytest.fixture(scope="module")
+def trading_agent(agent_config):
+    """One TradingAgent shared by the module's tests"""
+    agent = TradingAgent(agent_config["trading_agent"])
+    # Daily trades that exactly reach the limit, built once for the rejection cases
+    agent._test_saturated_trades = tuple(
+        {"id": i} for i in range(agent.risk_config["max_daily_trades"])
+    )
+    return agent
+
+@pytest.fixture(autouse=True)
+def reset_trading_agent(trading_agent):
+    """Clear positions, daily tracking and validation state before each test"""
+    trading_agent.cleanup()
+
 async def test_trading_agent_initialization(agent_config):
     """Test TradingAgent initialization"""
     agent = TradingAgent(agent_config["trading_agent"])
@@ -14,95 +28,55 @@ async def test_trading_agent_initialization(agent_config):
     assert agent.daily_trades == []
     assert agent.daily_pnl == 0.0
 
-def test_check_risk_limits_position_size(agent_config):
-    """Test position size risk limit checking"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    portfolio_value = 100000
-    
-    # Test trade within limits (5% of portfolio = $5000)
-    trade = {
-        "symbol": "AAPL",
-        "shares": 30,
-        "price": 150.0,  # Total value = $4500
-        "transaction_type": "PURCHASE"
-    }
-    result, message = agent.check_risk_limits(trade, portfolio_value)
-    assert result is True
-    assert message is None
-    
-    # Test trade exceeding position size limit
-    trade = {
-        "symbol": "AAPL",
-        "shares": 100,
-        "price": 150.0,  # Total value = $15000
-        "transaction_type": "PURCHASE"
-    }
-    result, message = agent.check_risk_limits(trade, portfolio_value)
-    assert result is False
-    assert "Position size" in message
+def _fill_daily_trades(agent):
+    """Add the maximum allowed daily trades"""
+    agent.daily_trades = list(agent._test_saturated_trades)
 
-def test_check_risk_limits_daily_trades(agent_config):
-    """Test daily trade limit checking"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    portfolio_value = 100000
-    
-    # Add maximum allowed daily trades
-    max_trades = agent.risk_config["max_daily_trades"]
-    agent.daily_trades = [{"id": i} for i in range(max_trades)]
-    
-    trade = {
-        "symbol": "AAPL",
-        "shares": 30,
-        "price": 150.0,
-        "transaction_type": "PURCHASE"
-    }
-    result, message = agent.check_risk_limits(trade, portfolio_value)
-    assert result is False
-    assert "Daily trade limit" in message
+def _hold_aapl(agent):
+    """Add existing AAPL position at 15% concentration"""
+    agent.positions["AAPL"] = {"shares": 100, "value": 15000.0}
 
-def test_check_risk_limits_concentration(agent_config):
-    """Test position concentration limit checking"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    portfolio_value = 100000
+@pytest.mark.parametrize("setup, shares, expected_ok, message_part", [
+    (None, 30, True, None),  # $4500, within 5% of portfolio
+    (None, 100, False, "Position size"),  # $15000
+    (_fill_daily_trades, 30, False, "Daily trade limit"),
+    (_hold_aapl, 50, False, "Symbol concentration"),  # Would add $7500 to position
+], ids=["within_limits", "position_size", "daily_trades", "concentration"])
+def test_check_risk_limits(trading_agent, setup, shares, expected_ok, message_part):
+    """Test position size, daily trade and concentration risk limit checking"""
+    if setup:
+        setup(trading_agent)
     
-    # Add existing position at 15% concentration
-    agent.positions["AAPL"] = {
-        "shares": 100,
-        "value": 15000.0
-    }
-    
-    # Test trade that would exceed concentration limit
     trade = {
         "symbol": "AAPL",
-        "shares": 50,
-        "price": 150.0,  # Would add $7500 to position
+        "shares": shares,
+        "price": 150.0,
         "transaction_type": "PURCHASE"
     }
-    result, message = agent.check_risk_limits(trade, portfolio_value)
-    assert result is False
-    assert "Symbol concentration" in message
+    result, message = trading_agent.check_risk_limits(trade, 100000)
+    assert result is expected_ok
+    if message_part is None:
+        assert message is None
+    else:
+        assert message_part in message
 
-def test_update_position_new_position(agent_config):
+def test_update_position_new_position(trading_agent):
     """Test position update for new position"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    
     trade = {
         "symbol": "AAPL",
         "shares": 100,
         "price": 150.0,
         "transaction_type": "PURCHASE"
     }
-    agent.update_position(trade)
-    assert "AAPL" in agent.positions
-    assert agent.positions["AAPL"]["value"] == 15000.0
-    assert agent.positions["AAPL"]["shares"] == 100
+    trading_agent.update_position(trade)
+    assert "AAPL" in trading_agent.positions
+    assert trading_agent.positions["AAPL"]["value"] == 15000.0
+    assert trading_agent.positions["AAPL"]["shares"] == 100
 
-def test_update_position_existing_position(agent_config):
+def test_update_position_existing_position(trading_agent):
     """Test position update for existing position"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    
     # Add initial position
-    agent.positions["AAPL"] = {
+    trading_agent.positions["AAPL"] = {
         "shares": 100,
         "value": 15000.0
     }
@@ -114,16 +88,14 @@ def test_update_position_existing_position(agent_config):
         "price": 160.0,
         "transaction_type": "PURCHASE"
     }
-    agent.update_position(trade)
-    assert agent.positions["AAPL"]["shares"] == 150
-    assert agent.positions["AAPL"]["value"] == 24000.0
+    trading_agent.update_position(trade)
+    assert trading_agent.positions["AAPL"]["shares"] == 150
+    assert trading_agent.positions["AAPL"]["value"] == 24000.0
 
-def test_update_position_full_sale(agent_config):
+def test_update_position_full_sale(trading_agent):
     """Test position update for complete position sale"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    
     # Add initial position
-    agent.positions["AAPL"] = {
+    trading_agent.positions["AAPL"] = {
         "shares": 100,
         "value": 15000.0
     }
@@ -135,109 +107,70 @@ def test_update_position_full_sale(agent_config):
         "price": 160.0,
         "transaction_type": "SALE"
     }
-    agent.update_position(trade)
-    assert "AAPL" not in agent.positions
+    trading_agent.update_position(trade)
+    assert "AAPL" not in trading_agent.positions
 
-@pytest.mark.asyncio
-async def test_execute_trade_success(agent_config):
-    """Test successful trade execution"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    portfolio_value = 100000
+@pytest.mark.parametrize("shares, fill_daily_trades, status, key", [
+    (30, False, "executed", "trade"),  # Small enough to pass risk limits
+    (100, True, "rejected", "reason"),  # Daily trade limit already reached
+], ids=["success", "rejection"])
+async def test_execute_trade(trading_agent, shares, fill_daily_trades, status, key):
+    """Test trade execution and rejection due to risk limits"""
+    if fill_daily_trades:
+        trading_agent.daily_trades = list(trading_agent._test_saturated_trades)
     
     trade = {
         "symbol": "AAPL",
-        "shares": 30,  # Small enough to pass risk limits
+        "shares": shares,
         "price": 150.0,
         "transaction_type": "PURCHASE"
     }
-    result = await agent.execute_trade(trade, portfolio_value)
-    assert result["status"] == "executed"
-    assert "trade" in result
+    result = await trading_agent.execute_trade(trade, 100000)
+    assert result["status"] == status
+    assert key in result
     assert "timestamp" in result
 
-@pytest.mark.asyncio
-async def test_execute_trade_rejection(agent_config):
-    """Test trade rejection due to risk limits"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    portfolio_value = 100000
-    
-    # Add maximum daily trades
-    max_trades = agent.risk_config["max_daily_trades"]
-    agent.daily_trades = [{"id": i} for i in range(max_trades)]
-    
-    trade = {
-        "symbol": "AAPL",
-        "shares": 100,
-        "price": 150.0,
-        "transaction_type": "PURCHASE"
-    }
-    result = await agent.execute_trade(trade, portfolio_value)
-    assert result["status"] == "rejected"
-    assert "reason" in result
-
-def test_get_portfolio_summary(agent_config):
+def test_get_portfolio_summary(trading_agent):
     """Test portfolio summary generation"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    
     # Add some positions
-    agent.positions["AAPL"] = {
+    trading_agent.positions["AAPL"] = {
         "shares": 100,
         "value": 15000.0
     }
-    agent.positions["MSFT"] = {
+    trading_agent.positions["MSFT"] = {
         "shares": 50,
         "value": 10000.0
     }
     
-    agent.daily_trades = [{"id": 1}, {"id": 2}]
-    agent.daily_pnl = 1000.0
+    trading_agent.daily_trades = [{"id": 1}, {"id": 2}]
+    trading_agent.daily_pnl = 1000.0
     
-    summary = agent.get_portfolio_summary()
+    summary = trading_agent.get_portfolio_summary()
     assert summary["total_value"] == 25000.0
     assert summary["position_count"] == 2
     assert summary["daily_trades"] == 2
     assert summary["daily_pnl"] == 1000.0
 
-@pytest.mark.asyncio
-async def test_execute_success(agent_config, sample_trade_data):
-    """Test successful execution of trading agent"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    portfolio_value = 100000
-    
-    # Modify sample trades to pass risk limits
-    modified_trades = []
-    for trade in sample_trade_data:
-        modified_trade = trade.copy()
-        modified_trade["shares"] = 30  # Small enough to pass risk limits
-        modified_trades.append(modified_trade)
-    
-    result = await agent.execute(modified_trades, portfolio_value)
-    assert result["status"] == "success"
+@pytest.mark.parametrize("make_trades, status, keys", [
+    # Sample trades cut to 30 shares, small enough to pass risk limits
+    (lambda sample: [{**trade, "shares": 30} for trade in sample],
+     "success", ("executions", "portfolio")),
+    (lambda sample: [{"invalid": "data"}], "error", ("error",)),
+], ids=["success", "error_handling"])
+async def test_execute(trading_agent, sample_trade_data, make_trades, status, keys):
+    """Test execution of trading agent, including error handling"""
+    result = await trading_agent.execute(make_trades(sample_trade_data), 100000)
+    assert result["status"] == status
     assert "timestamp" in result
-    assert "executions" in result
-    assert "portfolio" in result
+    for key in keys:
+        assert key in result
 
-@pytest.mark.asyncio
-async def test_execute_error_handling(agent_config):
-    """Test error handling during execution"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    
-    # Test with invalid data
-    invalid_data = [{"invalid": "data"}]
-    result = await agent.execute(invalid_data, 100000)
-    
-    assert result["status"] == "error"
-    assert "error" in result
-    assert "timestamp" in result
-
-def test_reset_daily_tracking(agent_config):
+def test_reset_daily_tracking(trading_agent):
     """Test reset of daily tracking metrics"""
-    agent = TradingAgent(agent_config["trading_agent"])
-    
     # Add some daily tracking data
-    agent.daily_trades = [{"id": 1}, {"id": 2}]
-    agent.daily_pnl = 1000.0
+    trading_agent.daily_trades = [{"id": 1}, {"id": 2}]
+    trading_agent.daily_pnl = 1000.0
     
-    agent.reset_daily_tracking()
-    assert agent.daily_trades == []
-    assert agent.daily_pnl == 0.0
\ No newline at end of file
+    trading_agent.reset_daily_tracking()
+    assert trading_agent.daily_trades == []
+    assert trading_agent.daily_pnl == 0.0
\ No newline at end of file
@@ -1,9 +1,17 @@
+import json
 import unittest
 from hello_world.tools.user_prompt import BaseUserPrompt
 
 class TestBaseUserPrompt(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.prompt = BaseUserPrompt()
+
     def setUp(self):
-        self.prompt = BaseUserPrompt()
+        # Reset the shared prompt's state left by the previous test
+        self.prompt.current_step = 0
+        self.prompt.total_steps = 0
+        self.prompt.status = ""
 
     def test_input_validation(self):
         # Test valid input
@@ -25,7 +33,6 @@ class TestBaseUserPrompt(unittest.TestCase):
         self.assertEqual(self.prompt.format_response(data, "text"), str(data))
 
         # Test JSON format
-        import json
         self.assertEqual(
             self.prompt.format_response(data, "json"),
             json.dumps(data)